@@ -5,11 +5,16 @@ it in a local SQLite database to minimize API calls and avoid rate limiting.
 """
 
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set
-import yaml
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from src.utils.config import load_config
 from src.utils.logger import get_logger
 from src.utils.database import NBADatabase
 
@@ -31,53 +36,81 @@ def get_database_path(config_path: str = "config.yaml") -> str:
 
     # Fall back to config file (development)
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
-            db_path = config.get("database", {}).get("path", "data/nba_games.db")
-            logger.info(f"Using database path from config: {db_path}")
-            return db_path
+        config = load_config(config_path)
+        db_path = config.get("database", {}).get("path", "data/nba_games.db")
+        logger.info(f"Using database path from config: {db_path}")
+        return db_path
     except Exception as e:
         logger.warning(f"Could not load config, using default: {e}")
         return "data/nba_games.db"
 
 
-# Delay between API calls to avoid rate limiting (in seconds)
+# Starting delay between API calls to avoid rate limiting (in seconds)
 API_DELAY = 0.6  # 600ms between calls
 
+# Bounds for the adaptive request rate (requests per second)
+MIN_REQUEST_RATE = 0.2
+MAX_REQUEST_RATE = 3.0
+
+# Requests that may start back to back after an idle spell (token bucket
+# capacity); lets sync_all's concurrent syncs start without queueing
+API_BURST = 3
+
+# Number of concurrent box score fetches during a date sync
+SYNC_WORKERS = 4
+
+# Connection pool size for the shared nba_api session; covers the
+# per-game workers plus the concurrent metadata syncs in sync_all
+HTTP_POOL_SIZE = 16
+
+# Longest Retry-After (seconds) honored before retrying a 429/503; kept
+# short because retries run inline in /api/sync, and the rate limiter's
+# backoff does the real slowing down
+MAX_RETRY_AFTER = 5
+
+# How long top teams / star players loaded from the database stay fresh
+METADATA_TTL = timedelta(hours=1)
+
+# How long past METADATA_TTL stale metadata may still be served while a
+# background reload runs; after this, callers wait for the reload
+METADATA_STALE_TTL = timedelta(hours=24)
+
 # Fallback data when API is unavailable
-FALLBACK_TOP_TEAMS = {"CLE", "BOS", "OKC", "HOU", "MEM"}
-FALLBACK_STAR_PLAYERS = {
-    "LeBron James",
-    "Stephen Curry",
-    "Kevin Durant",
-    "Giannis Antetokounmpo",
-    "Luka Doncic",
-    "Nikola Jokic",
-    "Joel Embiid",
-    "Jayson Tatum",
-    "Damian Lillard",
-    "Anthony Davis",
-    "Devin Booker",
-    "Kawhi Leonard",
-    "Jimmy Butler",
-    "Donovan Mitchell",
-    "Trae Young",
-    "Kyrie Irving",
-    "Shai Gilgeous-Alexander",
-    "Anthony Edwards",
-    "Tyrese Haliburton",
-    "Ja Morant",
-    "Jaylen Brown",
-    "De'Aaron Fox",
-    "Domantas Sabonis",
-    "Bam Adebayo",
-    "Pascal Siakam",
-    "Paolo Banchero",
-    "Chet Holmgren",
-    "Victor Wembanyama",
-    "Lauri Markkanen",
-    "Jalen Brunson",
-}
+FALLBACK_TOP_TEAMS = frozenset({"CLE", "BOS", "OKC", "HOU", "MEM"})
+FALLBACK_STAR_PLAYERS = frozenset(
+    {
+        "LeBron James",
+        "Stephen Curry",
+        "Kevin Durant",
+        "Giannis Antetokounmpo",
+        "Luka Doncic",
+        "Nikola Jokic",
+        "Joel Embiid",
+        "Jayson Tatum",
+        "Damian Lillard",
+        "Anthony Davis",
+        "Devin Booker",
+        "Kawhi Leonard",
+        "Jimmy Butler",
+        "Donovan Mitchell",
+        "Trae Young",
+        "Kyrie Irving",
+        "Shai Gilgeous-Alexander",
+        "Anthony Edwards",
+        "Tyrese Haliburton",
+        "Ja Morant",
+        "Jaylen Brown",
+        "De'Aaron Fox",
+        "Domantas Sabonis",
+        "Bam Adebayo",
+        "Pascal Siakam",
+        "Paolo Banchero",
+        "Chet Holmgren",
+        "Victor Wembanyama",
+        "Lauri Markkanen",
+        "Jalen Brunson",
+    }
+)
 
 
 class NBAAPIError(Exception):
@@ -100,19 +133,27 @@ class NBAClient:
         db_path = get_database_path(config_path)
         self.db = NBADatabase(db_path=db_path)
 
-        # Cache for runtime data
-        self._top_teams_cache: Optional[Set[str]] = None
-        self._star_players_cache: Optional[Set[str]] = None
-
-        # Load cached data from DB on startup
-        self._load_cached_metadata()
+        # Cache for runtime data (reloaded from DB once METADATA_TTL passes)
+        self._top_teams_cache: Optional[FrozenSet[str]] = None
+        self._star_players_cache: Optional[FrozenSet[str]] = None
+        # time.monotonic() deadlines; None forces a reload on next access, so
+        # metadata is only read from the DB once something actually needs it
+        self._metadata_expires_at: Optional[float] = None
+        self._metadata_stale_at: Optional[float] = None
+
+        # Single worker so at most one stale-while-revalidate reload runs
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="metadata-refresh"
+        )
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
 
     def _load_cached_metadata(self):
         """Load top teams and star players from database."""
         # Load top teams from standings
         top_teams = self.db.get_top_teams(5)
         if top_teams:
-            self._top_teams_cache = set(top_teams)
+            self._top_teams_cache = frozenset(abbr.upper() for abbr in top_teams)
             logger.info(f"Loaded top teams from DB: {self._top_teams_cache}")
         else:
             self._top_teams_cache = FALLBACK_TOP_TEAMS
@@ -121,7 +162,7 @@ class NBAClient:
         # Load star players from database
         star_players = self.db.get_star_players()
         if star_players:
-            self._star_players_cache = set(star_players)
+            self._star_players_cache = frozenset(star_players)
             logger.info(f"Loaded {len(self._star_players_cache)} star players from DB")
         else:
             self._star_players_cache = FALLBACK_STAR_PLAYERS
@@ -129,6 +170,50 @@ class NBAClient:
                 f"Using fallback star players: {len(self._star_players_cache)} players"
             )
 
+        expires_at = time.monotonic() + METADATA_TTL.total_seconds()
+        self._metadata_stale_at = expires_at + METADATA_STALE_TTL.total_seconds()
+        self._metadata_expires_at = expires_at
+
+    def invalidate_metadata(self):
+        """Force top teams and star players to be reloaded on next access.
+
+        Call after a sync so fresh standings are used without waiting
+        for METADATA_TTL to pass.
+        """
+        self._metadata_expires_at = None
+        self._metadata_stale_at = None
+
+    def _ensure_metadata(self):
+        """Make sure cached metadata is usable, reloading it if needed.
+
+        Fresh metadata is used as-is. Metadata past METADATA_TTL but within
+        METADATA_STALE_TTL is still served while a background reload picks
+        up new standings (stale-while-revalidate); only missing, invalidated
+        or very old metadata makes the caller wait for the database.
+        """
+        now = time.monotonic()
+        if self._metadata_expires_at is not None and now < self._metadata_expires_at:
+            return
+
+        if self._metadata_stale_at is not None and now < self._metadata_stale_at:
+            with self._refresh_lock:
+                if not self._refreshing:
+                    self._refreshing = True
+                    self._refresh_executor.submit(self._refresh_metadata)
+            return
+
+        self._load_cached_metadata()
+
+    def _refresh_metadata(self):
+        """Reload metadata in the background, keeping the old copy on failure."""
+        try:
+            self._load_cached_metadata()
+        except Exception as e:
+            logger.warning(f"Background metadata reload failed: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
+
     def get_games_last_n_days(self, days: int = 7) -> List[Dict]:
         """
         Fetch all completed games from the last N days.
@@ -139,6 +224,21 @@ class NBAClient:
         Returns:
             List of game dictionaries with detailed information
         """
+        return list(self.iter_games_last_n_days(days))
+
+    def iter_games_last_n_days(self, days: int = 7) -> Iterator[Dict]:
+        """
+        Yield completed games from the last N days one at a time.
+
+        Games are formatted lazily, so callers that only need a running
+        result (e.g. the best game) never hold every formatted game at once.
+
+        Args:
+            days: Number of days to look back
+
+        Yields:
+            Game dictionaries with detailed information
+        """
         # Start from yesterday to avoid checking today's incomplete games
         end_date = datetime.now() - timedelta(days=1)
         start_date = end_date - timedelta(days=days)
@@ -153,22 +253,18 @@ class NBAClient:
             logger.info(
                 f"Found {len(db_games)} games in database for {start_str} to {end_str}"
             )
-            return self._format_games_from_db(db_games)
+            yield from self._format_games_from_db(db_games)
+            return
 
         # If no games in DB, we need to sync first
         logger.warning(f"No games found in database for {start_str} to {end_str}")
         logger.warning("Run 'sync' command to populate the database first")
-        return []
 
-    def _format_games_from_db(self, db_games: List[Dict]) -> List[Dict]:
+    def _format_games_from_db(self, db_games: List[Dict]) -> Iterator[Dict]:
         """Format database game records to match expected output format."""
-        games = []
         for game in db_games:
             game_id = game["game_id"]
 
-            # Get star player count for this game
-            star_count = self.db.get_star_players_in_game(game_id)
-
             home_score = game["home_score"] or 0
             away_score = game["away_score"] or 0
 
@@ -187,29 +283,243 @@ class NBAClient:
                 },
                 "total_points": home_score + away_score,
                 "final_margin": abs(home_score - away_score),
-                "star_players_count": star_count,
+                "star_players_count": game["star_count"],
             }
-            games.append(game_info)
-
-        return games
+            yield game_info
 
     @property
-    def TOP_5_TEAMS(self) -> Set[str]:
+    def TOP_5_TEAMS(self) -> FrozenSet[str]:
         """Get top 5 teams."""
-        if self._top_teams_cache is None:
-            self._load_cached_metadata()
-        return self._top_teams_cache or FALLBACK_TOP_TEAMS
+        self._ensure_metadata()
+        return self._top_teams_cache
 
     @property
-    def STAR_PLAYERS(self) -> Set[str]:
+    def STAR_PLAYERS(self) -> FrozenSet[str]:
         """Get star players."""
-        if self._star_players_cache is None:
-            self._load_cached_metadata()
-        return self._star_players_cache or FALLBACK_STAR_PLAYERS
+        self._ensure_metadata()
+        return self._star_players_cache
 
     def is_top5_team(self, team_abbr: str) -> bool:
-        """Check if a team is in the top 5."""
-        return team_abbr in self.TOP_5_TEAMS
+        """Check if a team is in the top 5 (case-insensitive)."""
+        return team_abbr.upper() in self.TOP_5_TEAMS
+
+
+class _CappedRetry(Retry):
+    """Retry policy that honors Retry-After, but never waits too long.
+
+    A throttled stats.nba.com can ask for multi-minute pauses; waiting a
+    few seconds at most and letting the rate limiter slow down keeps a
+    sync inside the web worker's timeout. The first 429/5xx of a request
+    is reported through ``on_pushback`` so the limiter learns about it even
+    when a retry then succeeds; the retries that follow belong to the same
+    congestion event and aren't reported again.
+    """
+
+    def __init__(
+        self, *args, on_pushback: Optional[Callable[[], None]] = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.on_pushback = on_pushback
+
+    def new(self, **kwargs) -> "_CappedRetry":
+        # urllib3 builds a fresh Retry per attempt; carry the callback over
+        retry = super().new(**kwargs)
+        retry.on_pushback = self.on_pushback
+        return retry
+
+    def increment(self, method=None, url=None, response=None, *args, **kwargs):
+        if (
+            self.on_pushback
+            and response is not None
+            and response.status in self.status_forcelist
+            and not any(entry.status for entry in self.history)
+        ):
+            self.on_pushback()
+        return super().increment(method, url, response, *args, **kwargs)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+def _build_http_session(
+    on_pushback: Optional[Callable[[], None]] = None,
+) -> requests.Session:
+    """Build a pooled, retrying session for nba_api requests.
+
+    Transient 429/5xx responses are retried instead of aborting the whole
+    sync: after the server's Retry-After (capped at MAX_RETRY_AFTER) when
+    it sends one, otherwise with jittered exponential backoff. Failed
+    connects are retried once and read timeouts not at all, so a hung
+    server can't stall a sync for several full timeouts.
+
+    Args:
+        on_pushback: Called once per request the server answers with 429/5xx
+
+    Returns:
+        Configured requests session
+    """
+    retry = _CappedRetry(
+        total=3,
+        # Only status codes get the full retry budget: nba_api waits 30 s per
+        # read, and /api/sync runs inside a 120 s gunicorn worker timeout.
+        # Read timeouts are re-raised as-is (urllib3 would wrap them in a
+        # ConnectionError) so _request retries them once on a new session.
+        connect=1,
+        read=False,
+        backoff_factor=0.3,
+        backoff_jitter=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        on_pushback=on_pushback,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class RateLimiter:
+    """Thread-safe adaptive token-bucket rate limiter for nba_api requests.
+
+    Callers reserve request slots from a bucket holding up to ``burst``
+    tokens that refills at ``rate`` per second, so an idle limiter lets a
+    short burst through and then spaces requests evenly. The rate is halved
+    when the API pushes back (a timeout, a dropped connection, or the first
+    429/5xx of a request; its further retries don't count again) and raised
+    by 10% after a run of successes (AIMD), so throughput follows what
+    stats.nba.com is currently willing to serve.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = MIN_REQUEST_RATE,
+        max_rate: float = MAX_REQUEST_RATE,
+        increase_after: int = 20,
+        burst: int = 1,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Starting rate in requests per second
+            min_rate: Lowest rate penalize() can drop to
+            max_rate: Highest rate successes can raise it to
+            increase_after: Consecutive successes before raising the rate
+            burst: Requests allowed back to back after an idle spell
+        """
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max(max_rate, rate)
+        self.increase_after = increase_after
+        self.burst = max(1, burst)
+        self._successes = 0
+        # Time at which the bucket would be full again if nobody else asked
+        self._full_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until this caller's request slot arrives.
+
+        Each caller takes a token under the lock and sleeps outside it, so
+        concurrent workers are spaced out evenly once the burst is spent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self.rate
+            full_at = now if self._full_at is None else max(now, self._full_at)
+            # Start now while tokens remain, otherwise when the next one refills
+            slot = max(now, full_at - (self.burst - 1) * interval)
+            self._full_at = full_at + interval
+
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+
+    def record_success(self):
+        """Count a successful request, raising the rate after a streak."""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.increase_after:
+                self._successes = 0
+                self.rate = min(self.rate * 1.1, self.max_rate)
+
+    def penalize(self):
+        """Halve the rate after the API pushed back."""
+        with self._lock:
+            self._successes = 0
+            self.rate = max(self.rate / 2, self.min_rate)
+            logger.warning(f"nba_api pushed back, slowing to {self.rate:.2f} req/s")
+
+
+class _SharedHTTPSession:
+    """The pooled session nba_api sends every request through.
+
+    nba_api keeps a single class-level session, so it is installed once per
+    process rather than per NBASyncService. A replaced session is closed
+    as soon as the last request still running on it finishes.
+    """
+
+    def __init__(self, on_pushback: Callable[[], None]):
+        """
+        Args:
+            on_pushback: Passed to every session built (see _build_http_session)
+        """
+        self._on_pushback = on_pushback
+        self._session: Optional[requests.Session] = None
+        # In-flight request count per session, current or replaced
+        self._users: Dict[requests.Session, int] = {}
+        self._lock = threading.Lock()
+
+    def install(self):
+        """Give nba_api the shared session, building it on first use."""
+        with self._lock:
+            if self._session is None:
+                self._swap()
+
+    def checkout(self) -> requests.Session:
+        """Mark a request as running on the current session and return it."""
+        with self._lock:
+            if self._session is None:
+                self._swap()
+            self._users[self._session] = self._users.get(self._session, 0) + 1
+            return self._session
+
+    def checkin(self, session: requests.Session):
+        """Mark a request as done, closing its session if it was replaced."""
+        with self._lock:
+            self._users[session] -= 1
+            if self._users[session] or session is self._session:
+                return
+            del self._users[session]
+        session.close()
+
+    def replace(self, stale: requests.Session):
+        """Install a fresh session, unless another request already did."""
+        with self._lock:
+            if stale is self._session:
+                self._swap()
+
+    def _swap(self):
+        # nba_api shares one class-level session across all endpoints
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        self._session = _build_http_session(self._on_pushback)
+        NBAStatsHTTP.set_session(self._session)
+
+
+# One limiter and one session per process: every sync talks to the same
+# stats.nba.com, so concurrent syncs share its budget and its pushback
+_api_limiter = RateLimiter(1 / API_DELAY, burst=API_BURST)
+# Looked up at call time, so the session always slows the current limiter
+_http_session = _SharedHTTPSession(lambda: _api_limiter.penalize())
 
 
 class NBASyncService:
@@ -222,9 +532,98 @@ class NBASyncService:
         Args:
             config_path: Path to configuration file
         """
-        # Initialize database with env var or config path
+        # Initialize database with env var or config path; the sync service
+        # is the writer, so it switches the file to WAL for concurrent reads
         db_path = get_database_path(config_path)
-        self.db = NBADatabase(db_path=db_path)
+        self.db = NBADatabase(db_path=db_path, wal=True)
+
+        # Rate limiting (only spaces out actual API calls), shared by every
+        # sync in the process
+        self._limiter = _api_limiter
+
+        # Resolve the season once so a sync can't straddle a date rollover
+        self._season = self._get_current_season()
+        self._season_year = int(self._season.partition("-")[0])
+
+        _http_session.install()
+
+    def _request(self, endpoint_cls, **params):
+        """
+        Call an nba_api endpoint and return the loaded endpoint.
+
+        This is the single point every API request goes through, so rate
+        limiting and the timeout retry only need to live here.
+
+        Args:
+            endpoint_cls: nba_api endpoint class (e.g. LeagueGameFinder)
+            **params: Parameters passed to the endpoint
+
+        Returns:
+            Endpoint instance with its response loaded
+        """
+        for attempt in range(2):
+            self._limiter.acquire()
+            session = _http_session.checkout()
+            try:
+                endpoint = endpoint_cls(**params)
+            except requests.exceptions.Timeout:
+                self._limiter.penalize()
+                if attempt:
+                    raise
+                # stats.nba.com can leave pooled connections hanging; retry
+                # once on fresh connections rather than failing the whole sync
+                logger.warning(
+                    "%s timed out, retrying with a new session", endpoint_cls.__name__
+                )
+                _http_session.replace(session)
+                continue
+            # No penalty for RetryError (429/5xx retries exhausted): the
+            # session already slowed the limiter on this request's first one
+            except requests.exceptions.ConnectionError:
+                self._limiter.penalize()
+                raise
+            finally:
+                _http_session.checkin(session)
+
+            self._limiter.record_success()
+            return endpoint
+
+    def _fetch_data_frames(self, endpoint_cls, **params) -> list:
+        """
+        Call an nba_api endpoint and return its result sets as DataFrames.
+
+        Only worth it when the rows need pandas operations (e.g. a merge);
+        use _fetch_rows for data that goes straight into the database.
+
+        Args:
+            endpoint_cls: nba_api endpoint class (e.g. LeagueGameFinder)
+            **params: Parameters passed to the endpoint
+
+        Returns:
+            List of DataFrames, one per result set
+        """
+        return self._request(endpoint_cls, **params).get_data_frames()
+
+    def _fetch_rows(self, endpoint_cls, **params) -> List[List[Dict]]:
+        """
+        Call an nba_api endpoint and return its result sets as row dicts.
+
+        Skips the DataFrame construction nba_api does in get_data_frames():
+        the raw headers/rows are zipped directly into plain dicts.
+
+        Args:
+            endpoint_cls: nba_api endpoint class (e.g. LeagueGameFinder)
+            **params: Parameters passed to the endpoint
+
+        Returns:
+            List of result sets, each a list of {header: value} dicts
+        """
+        result_sets = []
+        for data_set in self._request(endpoint_cls, **params).data_sets:
+            data = data_set.get_dict()
+            headers = data["headers"]
+            result_sets.append([dict(zip(headers, row)) for row in data["data"]])
+        return result_sets
 
     def _get_current_season(self) -> str:
         """Get current NBA season string (e.g., '2024-25')."""
@@ -247,15 +646,19 @@ class NBASyncService:
         logger.info("Syncing NBA teams...")
         all_teams = nba_teams.get_teams()
 
-        for team in all_teams:
-            self.db.upsert_team(
-                team_id=team["id"],
-                abbreviation=team["abbreviation"],
-                full_name=team["full_name"],
-                city=team["city"],
-                conference=team.get("conference"),
-                division=team.get("division"),
-            )
+        self.db.upsert_teams(
+            [
+                {
+                    "team_id": team["id"],
+                    "abbreviation": team["abbreviation"],
+                    "full_name": team["full_name"],
+                    "city": team["city"],
+                    "conference": team.get("conference"),
+                    "division": team.get("division"),
+                }
+                for team in all_teams
+            ]
+        )
 
         self.db.set_last_sync("teams", f"Synced {len(all_teams)} teams")
         logger.info(f"Synced {len(all_teams)} teams")
@@ -271,34 +674,36 @@ class NBASyncService:
         from nba_api.stats.endpoints import leaguestandingsv3
 
         logger.info("Syncing standings...")
-        season = self._get_current_season()
+        season = self._season
 
         try:
-            time.sleep(API_DELAY)
-            standings = leaguestandingsv3.LeagueStandingsV3(
-                season=season, season_type="Regular Season"
-            )
-            df = standings.get_data_frames()[0]
-
-            count = 0
-            for _, row in df.iterrows():
-                self.db.upsert_standings(
-                    team_id=row["TeamID"],
-                    team_abbr=row["TeamSlug"].upper(),
-                    season=int(season.split("-")[0]),
-                    wins=row["WINS"],
-                    losses=row["LOSSES"],
-                    win_pct=row["WinPCT"],
-                    conf_rank=row["ConferenceRank"] if "ConferenceRank" in row else 0,
-                )
-                count += 1
+            rows = self._fetch_rows(
+                leaguestandingsv3.LeagueStandingsV3,
+                season=season,
+                season_type="Regular Season",
+            )[0]
+
+            standings = [
+                {
+                    "team_id": row["TeamID"],
+                    "team_abbr": row["TeamSlug"].upper(),
+                    "season": self._season_year,
+                    "wins": row["WINS"],
+                    "losses": row["LOSSES"],
+                    "win_pct": row["WinPCT"],
+                    "conf_rank": row.get("ConferenceRank", 0),
+                }
+                for row in rows
+            ]
+            self.db.upsert_standings_rows(standings)
+            count = len(standings)
 
             self.db.set_last_sync("standings", f"Synced {count} standings for {season}")
             logger.info(f"Synced {count} standings for {season}")
             return count
 
         except Exception as e:
-            logger.error(f"Error syncing standings: {e}")
+            logger.error(f"Error syncing standings: {e}", exc_info=True)
             return 0
 
     def sync_star_players(self, top_n: int = 30) -> int:
@@ -314,34 +719,36 @@ class NBASyncService:
         from nba_api.stats.endpoints import leagueleaders
 
         logger.info(f"Syncing top {top_n} scorers as star players...")
-        season = self._get_current_season()
+        season = self._season
 
         try:
-            time.sleep(API_DELAY)
-            leaders = leagueleaders.LeagueLeaders(
-                season=season, stat_category_abbreviation="PTS", per_mode48="PerGame"
-            )
-            df = leaders.get_data_frames()[0]
+            rows = self._fetch_rows(
+                leagueleaders.LeagueLeaders,
+                season=season,
+                stat_category_abbreviation="PTS",
+                per_mode48="PerGame",
+            )[0]
 
             star_names = []
-            for _, row in df.head(top_n).iterrows():
+            players = []
+            for row in rows[:top_n]:
                 player_name = row["PLAYER"]
                 star_names.append(player_name)
-
-                # Upsert player
-                self.db.upsert_player(
-                    player_id=row["PLAYER_ID"],
-                    first_name=player_name.split()[0]
-                    if " " in player_name
-                    else player_name,
-                    last_name=" ".join(player_name.split()[1:])
-                    if " " in player_name
-                    else "",
-                    team_id=row["TEAM_ID"],
-                    is_star=True,
-                    ppg=row["PTS"],
+                first_name, _, last_name = player_name.partition(" ")
+                players.append(
+                    {
+                        "player_id": row["PLAYER_ID"],
+                        "first_name": first_name,
+                        "last_name": last_name,
+                        "team_id": row["TEAM_ID"],
+                        "is_star": True,
+                        "ppg": row["PTS"],
+                    }
                 )
 
+            # Upsert players
+            self.db.upsert_players(players)
+
             # Mark these players as stars
             self.db.set_star_players(star_names)
 
@@ -352,14 +759,16 @@ class NBASyncService:
             return len(star_names)
 
         except Exception as e:
-            logger.error(f"Error syncing star players: {e}")
+            logger.error(f"Error syncing star players: {e}", exc_info=True)
             return 0
 
     def sync_games(self, days: int = 14) -> int:
         """
-        Sync games from the last N days to database.
+        Sync games from the last N days, and their player stats, to database.
 
         Uses LeagueGameFinder which is more reliable than scoreboardv2.
+        Player stats for the window cost one more request (LeagueGameLog),
+        plus a box score for each game that log is missing.
 
         Args:
             days: Number of days to sync
@@ -378,16 +787,12 @@ class NBASyncService:
         end_str = end_date.strftime("%Y-%m-%d")
 
         try:
-            time.sleep(API_DELAY)
-            # Get current season
-            season = self._get_current_season()
-
             # Fetch all completed games for the season
-            finder = leaguegamefinder.LeagueGameFinder(
-                season_nullable=season,
+            games_df = self._fetch_data_frames(
+                leaguegamefinder.LeagueGameFinder,
+                season_nullable=self._season,
                 season_type_nullable="Regular Season",
-            )
-            games_df = finder.get_data_frames()[0]
+            )[0]
 
             if games_df.empty:
                 logger.warning("No games found from LeagueGameFinder")
@@ -395,212 +800,201 @@ class NBASyncService:
 
             # Filter to date range
             games_df["GAME_DATE"] = games_df["GAME_DATE"].astype(str)
+            games_df["GAME_ID"] = games_df["GAME_ID"].astype(str)
             games_df = games_df[
                 (games_df["GAME_DATE"] >= start_str)
                 & (games_df["GAME_DATE"] <= end_str)
             ]
 
-            # LeagueGameFinder returns 2 rows per game (one per team)
-            # Group by GAME_ID to get unique games
-            unique_games = games_df.drop_duplicates("GAME_ID")
-            logger.info(f"Found {len(unique_games)} games in date range")
+            # LeagueGameFinder returns 2 rows per game (one per team).
+            # Pair them into one row per game with a single merge on GAME_ID:
+            # the home team's MATCHUP is "LAL vs. BOS", the away team's "BOS @ LAL"
+            logger.info(f"Found {games_df['GAME_ID'].nunique()} games in date range")
+
+            is_home = games_df["MATCHUP"].str.contains(" vs. ", regex=False)
+            team_cols = ["GAME_ID", "TEAM_ABBREVIATION", "PTS"]
+            paired_games = games_df.loc[is_home, team_cols + ["GAME_DATE"]].merge(
+                games_df.loc[~is_home, team_cols],
+                on="GAME_ID",
+                suffixes=("_HOME", "_AWAY"),
+            )
 
-            # Get season year for database
-            now = datetime.now()
-            season_year = now.year if now.month >= 10 else now.year - 1
+            # Final games never change, so stored ones act as a cache
+            existing_ids = self.db.get_final_game_ids(start_str, end_str)
 
-            count = 0
-            for _, game in unique_games.iterrows():
-                game_id = str(game["GAME_ID"])
+            # Only 30 teams: resolve abbreviations from one query, not two per game
+            team_ids = {
+                team["abbreviation"]: team["id"] for team in self.db.get_all_teams()
+            }
+
+            new_games = []
+            for game in paired_games.to_dict("records"):
+                game_id = game["GAME_ID"]
                 game_date = game["GAME_DATE"]
 
                 # Skip if already in database
-                if self.db.has_games_for_date(game_date):
-                    existing = self.db.get_games_for_date(game_date)
-                    if any(g["game_id"] == game_id for g in existing):
-                        continue
-
-                # Parse matchup to get teams (e.g., "LAL vs. BOS" or "LAL @ BOS")
-                matchup = game["MATCHUP"]
-                team_abbr = game["TEAM_ABBREVIATION"]
-                pts = game["PTS"]
-
-                # Get the other team's row for this game
-                other_team = games_df[
-                    (games_df["GAME_ID"] == game_id)
-                    & (games_df["TEAM_ABBREVIATION"] != team_abbr)
-                ]
-
-                if other_team.empty:
+                if game_id in existing_ids:
                     continue
 
-                other_abbr = other_team.iloc[0]["TEAM_ABBREVIATION"]
-                other_pts = other_team.iloc[0]["PTS"]
-
-                # Determine home vs away from matchup format
-                if " vs. " in matchup:
-                    # Team is home
-                    home_abbr, away_abbr = team_abbr, other_abbr
-                    home_score, away_score = pts, other_pts
-                else:
-                    # Team is away (@ format)
-                    home_abbr, away_abbr = other_abbr, team_abbr
-                    home_score, away_score = other_pts, pts
+                home_abbr = game["TEAM_ABBREVIATION_HOME"]
+                away_abbr = game["TEAM_ABBREVIATION_AWAY"]
+                home_score = game["PTS_HOME"]
+                away_score = game["PTS_AWAY"]
 
                 # Get team IDs
-                home_team = self.db.get_team_by_abbr(home_abbr)
-                away_team = self.db.get_team_by_abbr(away_abbr)
+                home_team_id = team_ids.get(home_abbr)
+                away_team_id = team_ids.get(away_abbr)
 
-                if not home_team or not away_team:
-                    logger.debug(f"Team not found: {home_abbr} or {away_abbr}")
+                if home_team_id is None or away_team_id is None:
+                    logger.debug("Team not found: %s or %s", home_abbr, away_abbr)
                     continue
 
-                self.db.upsert_game(
-                    game_id=game_id,
-                    game_date=game_date,
-                    home_team_id=home_team["id"],
-                    away_team_id=away_team["id"],
-                    home_score=int(home_score),
-                    away_score=int(away_score),
-                    status="Final",
-                    season=season_year,
+                new_games.append(
+                    {
+                        "game_id": game_id,
+                        "game_date": game_date,
+                        "home_team_id": home_team_id,
+                        "away_team_id": away_team_id,
+                        "home_score": int(home_score),
+                        "away_score": int(away_score),
+                        "status": "Final",
+                        "season": self._season_year,
+                    }
                 )
-                count += 1
+
+            # Write every new game in one transaction
+            self.db.upsert_games(new_games)
+            count = len(new_games)
+
+            # Fill in player stats for every stored game in the window, which
+            # also picks up games whose players an earlier sync missed. The
+            # games are already committed, so a failure here only logs.
+            game_ids = existing_ids | {game["game_id"] for game in new_games}
+            try:
+                self._sync_players(
+                    start_date.strftime("%m/%d/%Y"),
+                    end_date.strftime("%m/%d/%Y"),
+                    sorted(game_ids),
+                )
+            except Exception as e:
+                logger.warning(f"Error syncing player stats: {e}")
 
             self.db.set_last_sync("games", f"Synced {count} games for last {days} days")
             logger.info(f"Total games synced: {count}")
             return count
 
         except Exception as e:
-            logger.error(f"Error syncing games: {e}")
+            logger.error(f"Error syncing games: {e}", exc_info=True)
             return 0
 
-    def _sync_games_for_date(self, game_date: str) -> int:
+    def _sync_game_players(self, game_id: str):
         """
-        Sync games for a specific date.
+        Sync player stats for a specific game.
 
         Args:
-            game_date: Date in YYYY-MM-DD format
-
-        Returns:
-            Number of games synced
+            game_id: NBA game ID
         """
-        from nba_api.stats.endpoints import scoreboardv2
+        from nba_api.stats.endpoints import boxscoretraditionalv2
 
-        # Check if we already have games for this date
-        if self.db.has_games_for_date(game_date):
-            logger.debug(f"Games for {game_date} already in database, skipping")
-            return 0
+        # Skip if we already have player data for this game
+        if self.db.has_game_players(game_id):
+            return
 
         try:
-            time.sleep(API_DELAY)
-            # Convert date format for NBA API (MM/DD/YYYY)
-            date_parts = game_date.split("-")
-            nba_date = f"{date_parts[1]}/{date_parts[2]}/{date_parts[0]}"
-
-            scoreboard = scoreboardv2.ScoreboardV2(game_date=nba_date)
-            dfs = scoreboard.get_data_frames()
-            games_df = dfs[0]  # GameHeader
-            line_score_df = dfs[1]  # LineScore (has actual scores)
+            players = self._fetch_rows(
+                boxscoretraditionalv2.BoxScoreTraditionalV2, game_id=game_id
+            )[0]  # PlayerStats
 
-            if games_df.empty:
-                logger.debug(f"No games found for {game_date}")
-                return 0
+            self._store_game_players(players)
 
-            # Build score lookup from LineScore
-            # LineScore has 2 rows per game (home and away team)
-            scores = {}
-            for _, row in line_score_df.iterrows():
-                gid = str(row["GAME_ID"])
-                tid = row["TEAM_ID"]
-                pts = row.get("PTS") or 0
-                if gid not in scores:
-                    scores[gid] = {}
-                scores[gid][tid] = pts
-
-            # Get current season year
-            now = datetime.now()
-            season_year = now.year if now.month >= 10 else now.year - 1
-
-            count = 0
-            for _, game in games_df.iterrows():
-                # Only sync completed games
-                game_status = game.get("GAME_STATUS_TEXT", "")
-                if "Final" not in game_status:
-                    continue
-
-                game_id = str(game["GAME_ID"])
-                home_team_id = game["HOME_TEAM_ID"]
-                away_team_id = game["VISITOR_TEAM_ID"]
-
-                # Get scores from LineScore lookup
-                game_scores = scores.get(game_id, {})
-                home_score = game_scores.get(home_team_id, 0)
-                away_score = game_scores.get(away_team_id, 0)
-
-                self.db.upsert_game(
-                    game_id=game_id,
-                    game_date=game_date,
-                    home_team_id=home_team_id,
-                    away_team_id=away_team_id,
-                    home_score=home_score,
-                    away_score=away_score,
-                    status="Final",
-                    season=season_year,
-                )
-                count += 1
+        except Exception as e:
+            logger.warning("Error syncing players for game %s: %s", game_id, e)
 
-                # Sync player stats for this game
-                self._sync_game_players(game_id)
+    def _sync_players(self, date_from: str, date_to: str, game_ids: List[str]):
+        """
+        Sync player stats for games played in a date range.
 
-            logger.info(f"Synced {count} games for {game_date}")
-            return count
+        The whole range comes from one game log request; only games missing
+        from the log fall back to per-game box scores, fetched concurrently.
 
-        except Exception as e:
-            logger.warning(f"Error syncing games for {game_date}: {e}")
-            return 0
+        Args:
+            date_from: First date in MM/DD/YYYY format
+            date_to: Last date in MM/DD/YYYY format
+            game_ids: NBA game IDs played in that range
+        """
+        missing_game_ids = self._sync_players_for_dates(date_from, date_to, game_ids)
+        if not missing_game_ids:
+            return
+        with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as executor:
+            list(executor.map(self._sync_game_players, missing_game_ids))
 
-    def _sync_game_players(self, game_id: str):
+    def _sync_players_for_dates(
+        self, date_from: str, date_to: str, game_ids: List[str]
+    ) -> List[str]:
         """
-        Sync player stats for a specific game.
+        Sync player stats for many games with a single API call.
+
+        LeagueGameLog in player mode returns one row per player per game, so
+        a whole window of games costs one request instead of one box score
+        each.
 
         Args:
-            game_id: NBA game ID
+            date_from: First date in MM/DD/YYYY format
+            date_to: Last date in MM/DD/YYYY format
+            game_ids: NBA game IDs played in that range
+
+        Returns:
+            Game IDs the game log returned no player stats for
         """
-        from nba_api.stats.endpoints import boxscoretraditionalv2
+        from nba_api.stats.endpoints import leaguegamelog
 
-        # Skip if we already have player data for this game
-        if self.db.has_game_players(game_id):
-            return
+        pending = set(game_ids) - self.db.get_game_ids_with_players(game_ids)
+        if not pending:
+            return []
 
         try:
-            time.sleep(API_DELAY)
-            boxscore = boxscoretraditionalv2.BoxScoreTraditionalV2(game_id=game_id)
-            players_df = boxscore.get_data_frames()[0]  # PlayerStats
-
-            for _, player in players_df.iterrows():
-                player_name = player["PLAYER_NAME"]
-                self.db.upsert_game_player(
-                    game_id=game_id,
-                    player_id=player["PLAYER_ID"],
-                    player_name=player_name,
-                    team_id=player["TEAM_ID"],
-                    points=player.get("PTS") or 0,
-                    rebounds=player.get("REB") or 0,
-                    assists=player.get("AST") or 0,
-                )
+            players = self._fetch_rows(
+                leaguegamelog.LeagueGameLog,
+                player_or_team_abbreviation="P",
+                season=self._season,
+                date_from_nullable=date_from,
+                date_to_nullable=date_to,
+            )[0]
+        except Exception as e:
+            # Don't fan out to a box score per game while the API is failing;
+            # the games stay pending and the next sync picks them up
+            logger.warning(
+                "Error fetching player game log for %s-%s: %s", date_from, date_to, e
+            )
+            return []
 
-                # Also upsert the player to players table
-                name_parts = player_name.split(" ", 1)
-                self.db.upsert_player(
-                    player_id=player["PLAYER_ID"],
-                    first_name=name_parts[0],
-                    last_name=name_parts[1] if len(name_parts) > 1 else "",
-                    team_id=player["TEAM_ID"],
-                )
+        players = [p for p in players if str(p["GAME_ID"]) in pending]
+        self._store_game_players(players)
 
-        except Exception as e:
-            logger.warning(f"Error syncing players for game {game_id}: {e}")
+        return sorted(pending - {str(p["GAME_ID"]) for p in players})
+
+    def _store_game_players(self, players: List[Dict]):
+        """
+        Store player stat lines (and the players themselves) in one transaction.
+
+        Args:
+            players: Row dicts with GAME_ID, PLAYER_ID, PLAYER_NAME,
+                TEAM_ID, PTS, REB, AST keys
+        """
+        self.db.upsert_game_players(
+            [
+                {
+                    "game_id": str(player["GAME_ID"]),
+                    "player_id": player["PLAYER_ID"],
+                    "player_name": player["PLAYER_NAME"],
+                    "team_id": player["TEAM_ID"],
+                    "points": player.get("PTS") or 0,
+                    "rebounds": player.get("REB") or 0,
+                    "assists": player.get("AST") or 0,
+                }
+                for player in players
+            ]
+        )
 
     def sync_all(self, days: int = 14) -> Dict[str, int]:
         """
@@ -613,15 +1007,56 @@ class NBASyncService:
             Dictionary with sync counts
         """
         logger.info("Starting full sync...")
+        results = self._sync_after_teams(
+            {
+                "standings": self.sync_standings,
+                "star_players": self.sync_star_players,
+                "games": lambda: self.sync_games(days),
+            }
+        )
+        logger.info(f"Full sync complete: {results}")
+        return results
 
-        results = {
-            "teams": self.sync_teams(),
-            "standings": self.sync_standings(),
-            "star_players": self.sync_star_players(),
-            "games": self.sync_games(days),
-        }
+    def sync_metadata(self) -> Dict[str, int]:
+        """
+        Sync teams, standings, and star players (no games).
+
+        Returns:
+            Dictionary with sync counts
+        """
+        logger.info("Starting metadata sync...")
+        results = self._sync_after_teams(
+            {
+                "standings": self.sync_standings,
+                "star_players": self.sync_star_players,
+            }
+        )
+        logger.info(f"Metadata sync complete: {results}")
+        return results
+
+    def _sync_after_teams(self, syncs: Dict[str, Callable[[], int]]) -> Dict[str, int]:
+        """
+        Sync teams, then run the given independent syncs concurrently.
+
+        Args:
+            syncs: Mapping of result name to a zero-argument sync method
+
+        Returns:
+            Dictionary with sync counts, teams first
+        """
+        # Teams come from nba_api's static data (no network) and must exist
+        # before games can be matched to team IDs, so sync them first.
+        results = {"teams": self.sync_teams()}
+
+        # The remaining syncs are independent API calls, so overlap their
+        # network latency; the RateLimiter still spaces out the request starts
+        with ThreadPoolExecutor(max_workers=len(syncs)) as executor:
+            futures = {
+                sync_type: executor.submit(sync) for sync_type, sync in syncs.items()
+            }
+            for sync_type, future in futures.items():
+                results[sync_type] = future.result()
 
-        logger.info(f"Full sync complete: {results}")
         return results
 
     def get_sync_status(self) -> Dict[str, any]:
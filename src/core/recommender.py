@@ -1,10 +1,10 @@
 """NBA Game Recommender Engine."""
 
+from operator import itemgetter
 from typing import List, Dict, Optional
 from src.api.nba_api_client import NBAClient
 from src.core.game_scorer import GameScorer
-import yaml
-
+from src.utils.config import load_config
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -20,8 +20,7 @@ class GameRecommender:
         Args:
             config_path: Path to configuration file
         """
-        with open(config_path, "r") as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_path)
 
         # Use nba_api with SQLite caching as data source
         self.nba_client = NBAClient(config_path=config_path)
@@ -42,37 +41,33 @@ class GameRecommender:
         Returns:
             Dictionary with best game and its score breakdown
         """
-        # Fetch games
+        # Stream games and score them one at a time, keeping only the best
+        # (first wins ties), so the window is never held as a list
         logger.info(f"Fetching NBA games from the last {days} days...")
-        games = self.nba_client.get_games_last_n_days(days)
-
-        if not games:
-            logger.warning("No completed games found")
-            return None
-
-        logger.info(f"Found {len(games)} completed games")
-
-        # Score all games
-        scored_games = []
+        best_game = None
+        game_count = 0
         fav_team = favorite_team or self.favorite_team
+        top5_teams = self.nba_client.TOP_5_TEAMS
 
-        for game in games:
+        for game in self.nba_client.iter_games_last_n_days(days):
+            game_count += 1
             score_result = self.scorer.score_game(
-                game, favorite_team=fav_team, top5_teams=self.nba_client.TOP_5_TEAMS
+                game, favorite_team=fav_team, top5_teams=top5_teams
             )
 
-            scored_games.append(
-                {
+            if best_game is None or score_result["score"] > best_game["score"]:
+                best_game = {
                     "game": game,
                     "score": score_result["score"],
                     "breakdown": score_result["breakdown"],
                 }
-            )
 
-        # Sort by score (descending)
-        scored_games.sort(key=lambda x: x["score"], reverse=True)
+        if not game_count:
+            logger.warning("No completed games found")
+            return None
 
-        return scored_games[0] if scored_games else None
+        logger.info(f"Scored {game_count} completed games")
+        return best_game
 
     def get_all_games_ranked(
         self, days: int = 7, favorite_team: Optional[str] = None
@@ -93,27 +88,23 @@ class GameRecommender:
         if not games:
             return []
 
-        # Score all games
-        scored_games = []
+        # Score all games and sort by score (descending) in one pass
         fav_team = favorite_team or self.favorite_team
+        top5_teams = self.nba_client.TOP_5_TEAMS
 
-        for game in games:
-            score_result = self.scorer.score_game(
-                game, favorite_team=fav_team, top5_teams=self.nba_client.TOP_5_TEAMS
-            )
-
-            scored_games.append(
+        return sorted(
+            (
                 {
                     "game": game,
-                    "score": score_result["score"],
-                    "breakdown": score_result["breakdown"],
+                    **self.scorer.score_game(
+                        game, favorite_team=fav_team, top5_teams=top5_teams
+                    ),
                 }
-            )
-
-        # Sort by score (descending)
-        scored_games.sort(key=lambda x: x["score"], reverse=True)
-
-        return scored_games
+                for game in games
+            ),
+            key=itemgetter("score"),
+            reverse=True,
+        )
 
     def format_score_explanation(self, result: Dict) -> str:
         """
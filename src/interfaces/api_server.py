@@ -10,16 +10,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.core.recommender import GameRecommender
 from src.services.game_service import GameService
+from src.utils.config import load_config
 from src.utils.logger import get_logger
-import yaml
 
 logger = get_logger(__name__)
 
 app = Flask(__name__)
 
 # Load configuration
-with open("config.yaml", "r") as f:
-    config = yaml.safe_load(f)
+config = load_config("config.yaml")
 
 # Create recommender (can be mocked by tests)
 recommender = GameRecommender()
@@ -102,11 +102,7 @@ Examples:
 
         if args.metadata_only:
             logger.info("Syncing NBA metadata (teams, standings, star players)...")
-            results = {
-                "teams": sync_service.sync_teams(),
-                "standings": sync_service.sync_standings(),
-                "star_players": sync_service.sync_star_players(),
-            }
+            results = sync_service.sync_metadata()
         elif args.games_only:
             logger.info(f"Syncing NBA games for last {args.days} days...")
             results = {"games": sync_service.sync_games(days=args.days)}
@@ -3,6 +3,8 @@
 
 import os
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
 from flask import Flask, render_template, request, jsonify
 from datetime import datetime
@@ -13,8 +15,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from src.core.recommender import GameRecommender
 from src.services.game_service import GameService
 from src.api.nba_api_client import NBASyncService
+from src.utils.config import load_config
 from src.utils.logger import get_logger
-import yaml
 
 logger = get_logger(__name__)
 
@@ -24,17 +26,19 @@ SYNC_TOKEN = os.environ.get("SYNC_TOKEN")
 app = Flask(__name__)
 
 # Load configuration
-with open("config.yaml", "r") as f:
-    config = yaml.safe_load(f)
+config = load_config("config.yaml")
 
 # Create recommender (can be mocked by tests)
 recommender = GameRecommender()
 # Use the shared game service with the recommender
 game_service = GameService(recommender=recommender)
 
-# Request-level cache for ranked games (in-memory with TTL)
-_request_cache = {}
+# Request-level cache for ranked games (in-memory with TTL), kept in
+# insertion order so the oldest entries are always at the front.
+# Entries are (data, time.monotonic() when stored).
+_request_cache = OrderedDict()
 _cache_ttl_seconds = 300  # 5 minutes
+_cache_max_entries = 100
 
 
 def get_cached_or_fetch(cache_key: str, fetch_func, ttl_seconds: int = 300):
@@ -49,12 +53,10 @@ def get_cached_or_fetch(cache_key: str, fetch_func, ttl_seconds: int = 300):
     Returns:
         Cached or freshly fetched data
     """
-    global _request_cache
-
     # Check if we have cached data
     if cache_key in _request_cache:
         cached_data, cached_time = _request_cache[cache_key]
-        age = (datetime.now() - cached_time).total_seconds()
+        age = time.monotonic() - cached_time
 
         if age < ttl_seconds:
             logger.info(f"Cache HIT for {cache_key} (age: {age:.1f}s)")
@@ -65,14 +67,20 @@ def get_cached_or_fetch(cache_key: str, fetch_func, ttl_seconds: int = 300):
     # Cache miss or expired - fetch fresh data
     logger.info(f"Cache MISS for {cache_key} - fetching fresh data")
     fresh_data = fetch_func()
-    _request_cache[cache_key] = (fresh_data, datetime.now())
+    now = time.monotonic()
+    _request_cache[cache_key] = (fresh_data, now)
+    _request_cache.move_to_end(cache_key)
+
+    # Drop expired entries from the front; stops at the first fresh one
+    while _request_cache:
+        _, cached_time = next(iter(_request_cache.values()))
+        if now - cached_time < ttl_seconds:
+            break
+        _request_cache.popitem(last=False)
 
-    # Clean up old cache entries (keep cache size bounded)
-    if len(_request_cache) > 100:
-        # Remove oldest 50% of entries
-        sorted_keys = sorted(_request_cache.items(), key=lambda x: x[1][1])
-        for key, _ in sorted_keys[:50]:
-            del _request_cache[key]
+    # Keep cache size bounded: evict the oldest entries one at a time
+    while len(_request_cache) > _cache_max_entries:
+        _request_cache.popitem(last=False)
 
     return fresh_data
 
@@ -117,9 +125,9 @@ def sync_data():
         sync_service = NBASyncService()
         results = sync_service.sync_all(days=7)
 
-        # Clear request cache after sync so new data is served
-        global _request_cache
-        _request_cache = {}
+        # Clear request cache and metadata after sync so new data is served
+        _request_cache.clear()
+        recommender.nba_client.invalidate_metadata()
 
         logger.info(f"Sync completed successfully: {results}")
         return jsonify(
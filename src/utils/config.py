@@ -0,0 +1,36 @@
+"""Cached loading of the YAML configuration file."""
+
+import os
+from functools import lru_cache
+from typing import Any, Dict
+
+import yaml
+
+# libyaml's C loader parses much faster than the pure-Python SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
+    """
+    Load a YAML config file, reusing the parsed result while it is unchanged.
+
+    The returned dict is shared between callers; treat it as read-only.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Parsed configuration (empty dict for an empty file)
+
+    Raises:
+        FileNotFoundError: If the config file does not exist
+    """
+    mtime_ns = os.stat(config_path).st_mtime_ns
+    return _parse_config(config_path, mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file (mtime_ns is only part of the cache key)."""
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
@@ -3,7 +3,7 @@
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 from contextlib import contextmanager
 
 from src.utils.logger import get_logger
@@ -16,15 +16,33 @@ class NBADatabase:
 
     SCHEMA_VERSION = 1
 
-    def __init__(self, db_path: str = "data/nba_games.db"):
+    SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+    def __init__(
+        self,
+        db_path: str = "data/nba_games.db",
+        synchronous: str = "NORMAL",
+        wal: bool = False,
+    ):
         """
         Initialize the database.
 
         Args:
             db_path: Path to SQLite database file
+            synchronous: SQLite synchronous level; NORMAL is crash-safe in
+                WAL mode, use FULL to fsync on every commit
+            wal: Switch the database file to WAL journaling. The mode is
+                stored in the file itself, so only the writer (the sync
+                service) should turn it on
         """
+        synchronous = synchronous.upper()
+        if synchronous not in self.SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
+
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.synchronous = synchronous
+        self.wal = wal
         self._init_database()
 
     @contextmanager
@@ -32,6 +50,9 @@ class NBADatabase:
         """Context manager for database connections."""
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
+        # Per-connection settings (journal_mode is persisted in _init_database)
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute("PRAGMA temp_store = MEMORY")
         try:
             yield conn
             conn.commit()
@@ -46,6 +67,10 @@ class NBADatabase:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
+            # WAL lets readers run during a sync and avoids the rollback journal
+            if self.wal:
+                cursor.execute("PRAGMA journal_mode = WAL")
+
             # Schema version tracking
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS schema_info (
@@ -207,6 +232,26 @@ class NBADatabase:
                 ),
             )
 
+    def upsert_teams(self, teams: List[Dict]):
+        """Insert or update many teams in a single transaction.
+
+        Args:
+            teams: Dicts with the same keys as upsert_team's arguments
+        """
+        if not teams:
+            return
+        updated_at = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO teams
+                (id, abbreviation, full_name, city, conference, division, updated_at)
+                VALUES (:team_id, :abbreviation, :full_name, :city, :conference,
+                        :division, :updated_at)
+            """,
+                [{**team, "updated_at": updated_at} for team in teams],
+            )
+
     def get_team_by_abbr(self, abbreviation: str) -> Optional[Dict]:
         """Get team by abbreviation."""
         with self._get_connection() as conn:
@@ -256,6 +301,37 @@ class NBADatabase:
                 ),
             )
 
+    def upsert_players(self, players: List[Dict]):
+        """Insert or update many players in a single transaction.
+
+        Args:
+            players: Dicts with the same keys as upsert_player's arguments
+        """
+        if not players:
+            return
+        updated_at = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO players
+                (id, first_name, last_name, full_name, team_id, is_star_player, ppg, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        player["player_id"],
+                        player["first_name"],
+                        player["last_name"],
+                        f"{player['first_name']} {player['last_name']}".strip(),
+                        player.get("team_id"),
+                        1 if player.get("is_star") else 0,
+                        player.get("ppg"),
+                        updated_at,
+                    )
+                    for player in players
+                ],
+            )
+
     def get_star_players(self) -> List[str]:
         """Get list of star player names."""
         with self._get_connection() as conn:
@@ -264,16 +340,20 @@ class NBADatabase:
             return [row["full_name"] for row in cursor.fetchall()]
 
     def set_star_players(self, player_names: List[str]):
-        """Mark players as stars by name."""
+        """Mark players as stars by name (and clear the flag on everyone else)."""
+        names = sorted(set(player_names))
+        placeholders = ",".join("?" * len(names))
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            # Reset all star status
-            cursor.execute("UPDATE players SET is_star_player = 0")
-            # Set new stars
-            for name in player_names:
-                cursor.execute(
-                    "UPDATE players SET is_star_player = 1 WHERE full_name = ?", (name,)
-                )
+            # Reset and set star status in a single pass over the table
+            cursor.execute(
+                f"""
+                UPDATE players
+                SET is_star_player = CASE WHEN full_name IN ({placeholders})
+                                          THEN 1 ELSE 0 END
+            """,
+                names,
+            )
 
     # Game operations
     def upsert_game(
@@ -310,6 +390,27 @@ class NBADatabase:
                 ),
             )
 
+    def upsert_games(self, games: List[Dict]):
+        """Insert or update many games in a single transaction.
+
+        Args:
+            games: Dicts with the same keys as upsert_game's arguments
+        """
+        if not games:
+            return
+        updated_at = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO games
+                (id, game_date, home_team_id, away_team_id, home_score, away_score,
+                 status, season, updated_at)
+                VALUES (:game_id, :game_date, :home_team_id, :away_team_id,
+                        :home_score, :away_score, :status, :season, :updated_at)
+            """,
+                [{**game, "updated_at": updated_at} for game in games],
+            )
+
     def get_games_for_date(self, game_date: str) -> List[Dict]:
         """Get all games for a specific date with team info."""
         with self._get_connection() as conn:
@@ -337,7 +438,7 @@ class NBADatabase:
             return [dict(row) for row in cursor.fetchall()]
 
     def get_games_in_range(self, start_date: str, end_date: str) -> List[Dict]:
-        """Get all completed games in a date range."""
+        """Get all completed games in a date range, with their star player counts."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -352,7 +453,13 @@ class NBADatabase:
                     ht.abbreviation as home_abbr,
                     ht.full_name as home_name,
                     at.abbreviation as away_abbr,
-                    at.full_name as away_name
+                    at.full_name as away_name,
+                    (
+                        SELECT COUNT(DISTINCT gp.player_id)
+                        FROM game_players gp
+                        JOIN players p ON gp.player_id = p.id
+                        WHERE gp.game_id = g.id AND p.is_star_player = 1
+                    ) as star_count
                 FROM games g
                 JOIN teams ht ON g.home_team_id = ht.id
                 JOIN teams at ON g.away_team_id = at.id
@@ -363,6 +470,19 @@ class NBADatabase:
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_final_game_ids(self, start_date: str, end_date: str) -> Set[str]:
+        """Get IDs of completed games already stored for a date range."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id FROM games
+                WHERE game_date BETWEEN ? AND ? AND status = 'Final'
+            """,
+                (start_date, end_date),
+            )
+            return {row["id"] for row in cursor.fetchall()}
+
     def has_games_for_date(self, game_date: str) -> bool:
         """Check if we have games cached for a date."""
         with self._get_connection() as conn:
@@ -396,6 +516,58 @@ class NBADatabase:
                 (game_id, player_id, player_name, team_id, points, rebounds, assists),
             )
 
+    def upsert_game_players(self, game_players: List[Dict]):
+        """Insert or update many player stat lines in a single transaction.
+
+        Each player is also upserted into the players table. Unlike
+        upsert_player, existing rows keep their is_star_player flag.
+
+        Args:
+            game_players: Dicts with the same keys as upsert_game_player's
+                arguments
+        """
+        if not game_players:
+            return
+        updated_at = datetime.now().isoformat()
+        players = []
+        for gp in game_players:
+            first_name, _, last_name = gp["player_name"].partition(" ")
+            players.append(
+                (
+                    gp["player_id"],
+                    first_name,
+                    last_name,
+                    gp["player_name"].strip(),
+                    gp["team_id"],
+                    updated_at,
+                )
+            )
+
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO game_players
+                (game_id, player_id, player_name, team_id, points, rebounds, assists)
+                VALUES (:game_id, :player_id, :player_name, :team_id,
+                        :points, :rebounds, :assists)
+            """,
+                game_players,
+            )
+            conn.executemany(
+                """
+                INSERT INTO players
+                (id, first_name, last_name, full_name, team_id, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    first_name = excluded.first_name,
+                    last_name = excluded.last_name,
+                    full_name = excluded.full_name,
+                    team_id = excluded.team_id,
+                    updated_at = excluded.updated_at
+            """,
+                players,
+            )
+
     def get_star_players_in_game(self, game_id: str) -> int:
         """Count star players who played in a game."""
         with self._get_connection() as conn:
@@ -422,6 +594,19 @@ class NBADatabase:
             row = cursor.fetchone()
             return row["cnt"] > 0
 
+    def get_game_ids_with_players(self, game_ids: List[str]) -> Set[str]:
+        """Get which of the given games already have player stats stored."""
+        if not game_ids:
+            return set()
+        placeholders = ",".join("?" * len(game_ids))
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT DISTINCT game_id FROM game_players WHERE game_id IN ({placeholders})",
+                list(game_ids),
+            )
+            return {row["game_id"] for row in cursor.fetchall()}
+
     # Standings operations
     def upsert_standings(
         self,
@@ -454,6 +639,26 @@ class NBADatabase:
                 ),
             )
 
+    def upsert_standings_rows(self, standings: List[Dict]):
+        """Insert or update standings for many teams in a single transaction.
+
+        Args:
+            standings: Dicts with the same keys as upsert_standings' arguments
+        """
+        if not standings:
+            return
+        updated_at = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO standings
+                (team_id, team_abbr, season, wins, losses, win_pct, conference_rank, updated_at)
+                VALUES (:team_id, :team_abbr, :season, :wins, :losses, :win_pct,
+                        :conf_rank, :updated_at)
+            """,
+                [{**row, "updated_at": updated_at} for row in standings],
+            )
+
     def get_top_teams(self, top_n: int = 5) -> List[str]:
         """Get top N teams by win percentage."""
         with self._get_connection() as conn:
@@ -1,5 +1,6 @@
 """Shared pytest fixtures and configuration."""
 
+import os
 import pytest
 import sys
 import shutil
@@ -11,12 +12,18 @@ from unittest.mock import Mock, patch
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Interface modules build their recommender at import time; point them at a
+# scratch database so the suite never touches the tracked data/nba_games.db
+test_db_dir = tempfile.mkdtemp(prefix="nba_test_db_")
+os.environ["DATABASE_PATH"] = str(Path(test_db_dir) / "nba_games.db")
+
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Set up test environment before any tests run."""
     # Clean up test databases after tests
     yield
+    shutil.rmtree(test_db_dir, ignore_errors=True)
     # Cleanup test database directory if it exists
     test_data_dir = Path(project_root) / "data"
     if test_data_dir.exists():
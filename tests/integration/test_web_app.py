@@ -0,0 +1,77 @@
+"""Integration tests for the web interface's request cache."""
+
+import pytest
+from unittest.mock import Mock, patch
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.interfaces.web import app as web_app
+
+
+class TestRequestCache:
+    """Tests for get_cached_or_fetch eviction."""
+
+    @pytest.fixture(autouse=True)
+    def cache(self, monkeypatch):
+        """Start every test from an empty cache holding at most 3 entries."""
+        monkeypatch.setattr(web_app, "_cache_max_entries", 3)
+        web_app._request_cache.clear()
+        yield web_app._request_cache
+        web_app._request_cache.clear()
+
+    @pytest.fixture
+    def clock(self):
+        """Control the monotonic clock the cache stamps entries with."""
+        with patch("src.interfaces.web.app.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 1000.0
+            yield mock_monotonic
+
+    def test_hit_skips_fetch(self, cache, clock):
+        """Test a fresh entry is served without calling the fetcher."""
+        fetch = Mock(return_value="ranked")
+
+        assert web_app.get_cached_or_fetch("a", fetch, ttl_seconds=60) == "ranked"
+        clock.return_value += 30
+        assert web_app.get_cached_or_fetch("a", fetch, ttl_seconds=60) == "ranked"
+
+        fetch.assert_called_once()
+
+    def test_expired_entries_purged_from_front(self, cache, clock):
+        """Test stale entries at the front are dropped on the next store."""
+        web_app.get_cached_or_fetch("old1", lambda: 1, ttl_seconds=60)
+        web_app.get_cached_or_fetch("old2", lambda: 2, ttl_seconds=60)
+        clock.return_value += 45
+        web_app.get_cached_or_fetch("recent", lambda: 3, ttl_seconds=60)
+
+        clock.return_value += 30
+        web_app.get_cached_or_fetch("new", lambda: 4, ttl_seconds=60)
+
+        assert list(cache) == ["recent", "new"]
+
+    def test_size_capped_at_max_entries(self, cache, clock):
+        """Test the oldest fresh entries are evicted beyond the cap."""
+        for key in ["a", "b", "c", "d", "e"]:
+            clock.return_value += 1
+            web_app.get_cached_or_fetch(key, lambda: key, ttl_seconds=60)
+
+        assert list(cache) == ["c", "d", "e"]
+
+    def test_refreshed_key_moves_to_end(self, cache, clock):
+        """Test refetching an expired key re-stamps it as the newest entry."""
+        web_app.get_cached_or_fetch("a", lambda: "stale", ttl_seconds=60)
+        clock.return_value += 10
+        web_app.get_cached_or_fetch("b", lambda: "b", ttl_seconds=60)
+        clock.return_value += 55
+
+        assert web_app.get_cached_or_fetch("a", lambda: "fresh", ttl_seconds=60) == (
+            "fresh"
+        )
+        assert list(cache) == ["b", "a"]
+
+        # "a" now outlives "b", which expires first and is evicted from the front
+        clock.return_value += 10
+        web_app.get_cached_or_fetch("c", lambda: "c", ttl_seconds=60)
+        assert list(cache) == ["a", "c"]
@@ -0,0 +1,44 @@
+"""Unit tests for cached config loading."""
+
+import os
+import tempfile
+
+import pytest
+
+from src.utils.config import load_config
+
+
+class TestLoadConfig:
+    """Test cases for load_config."""
+
+    @pytest.fixture
+    def config_path(self):
+        """Create a temporary config file."""
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yaml") as f:
+            f.write("favorite_team: LAL\n")
+            path = f.name
+
+        yield path
+
+        os.unlink(path)
+
+    def test_load_config_parses_yaml(self, config_path):
+        """Test the config file is parsed into a dict."""
+        assert load_config(config_path) == {"favorite_team": "LAL"}
+
+    def test_load_config_reuses_parse_until_file_changes(self, config_path):
+        """Test repeat loads share one parse and edits are picked up."""
+        first = load_config(config_path)
+        assert load_config(config_path) is first
+
+        with open(config_path, "w") as f:
+            f.write("favorite_team: BOS\n")
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert load_config(config_path) == {"favorite_team": "BOS"}
+
+    def test_load_config_missing_file_raises(self):
+        """Test a missing config file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_config("nonexistent.yaml")
@@ -1,6 +1,7 @@
 """Unit tests for NBADatabase class."""
 
 import pytest
+import shutil
 import tempfile
 import os
 from datetime import datetime
@@ -37,6 +38,28 @@ class TestNBADatabase:
         assert "standings_count" in stats
 
     # Team operations
+    def test_initialization_keeps_journal_mode_by_default(self, temp_db):
+        """Test a plain database doesn't rewrite the file's journal mode."""
+        with temp_db._get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+            # 1 == NORMAL
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_initialization_enables_wal_when_asked(self):
+        """Test wal=True switches the database file to WAL journaling."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            db = NBADatabase(db_path=os.path.join(temp_dir, "nba.db"), wal=True)
+            with db._get_connection() as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_initialization_rejects_unknown_synchronous_level(self):
+        """Test the synchronous level is validated before reaching the PRAGMA."""
+        with pytest.raises(ValueError):
+            NBADatabase(db_path=":memory:", synchronous="NORMAL; DROP TABLE games")
+
     def test_upsert_team(self, temp_db):
         """Test inserting and updating a team."""
         temp_db.upsert_team(
@@ -53,6 +76,32 @@ class TestNBADatabase:
         assert team["full_name"] == "Los Angeles Lakers"
         assert team["city"] == "Los Angeles"
 
+    def test_upsert_teams(self, temp_db):
+        """Test inserting many teams at once."""
+        temp_db.upsert_teams(
+            [
+                {
+                    "team_id": 1,
+                    "abbreviation": "LAL",
+                    "full_name": "Los Angeles Lakers",
+                    "city": "Los Angeles",
+                    "conference": None,
+                    "division": None,
+                },
+                {
+                    "team_id": 2,
+                    "abbreviation": "BOS",
+                    "full_name": "Boston Celtics",
+                    "city": "Boston",
+                    "conference": None,
+                    "division": None,
+                },
+            ]
+        )
+
+        assert temp_db.get_team_by_abbr("BOS")["full_name"] == "Boston Celtics"
+        assert len(temp_db.get_all_teams()) == 2
+
     def test_get_all_teams(self, temp_db):
         """Test getting all teams."""
         temp_db.upsert_team(1, "LAL", "Los Angeles Lakers")
@@ -79,6 +128,23 @@ class TestNBADatabase:
         stars = temp_db.get_star_players()
         assert "LeBron James" in stars
 
+    def test_upsert_players(self, temp_db):
+        """Test inserting many players at once."""
+        temp_db.upsert_players(
+            [
+                {
+                    "player_id": 1,
+                    "first_name": "LeBron",
+                    "last_name": "James",
+                    "is_star": True,
+                    "ppg": 25.1,
+                },
+                {"player_id": 2, "first_name": "Joe", "last_name": "Smith"},
+            ]
+        )
+
+        assert temp_db.get_star_players() == ["LeBron James"]
+
     def test_get_star_players(self, temp_db):
         """Test getting star players."""
         temp_db.upsert_player(1, "LeBron", "James", is_star=True)
@@ -104,6 +170,17 @@ class TestNBADatabase:
         assert len(stars) == 1
         assert "LeBron James" in stars
 
+    def test_set_star_players_replaces_previous_stars(self, temp_db):
+        """Test that setting stars clears stars not in the new list."""
+        temp_db.upsert_player(1, "LeBron", "James", is_star=True)
+        temp_db.upsert_player(2, "Stephen", "Curry")
+
+        temp_db.set_star_players(["Stephen Curry", "Stephen Curry"])
+        assert temp_db.get_star_players() == ["Stephen Curry"]
+
+        temp_db.set_star_players([])
+        assert temp_db.get_star_players() == []
+
     # Game operations
     def test_upsert_game(self, temp_db):
         """Test inserting and updating a game."""
@@ -139,6 +216,23 @@ class TestNBADatabase:
         games = temp_db.get_games_in_range("2024-12-11", "2024-12-14")
         assert len(games) == 1
         assert games[0]["game_id"] == "2"
+        assert games[0]["star_count"] == 0
+
+    def test_get_games_in_range_counts_star_players(self, temp_db):
+        """Test each game in a range carries its star player count."""
+        temp_db.upsert_team(1, "LAL", "Los Angeles Lakers")
+        temp_db.upsert_team(2, "BOS", "Boston Celtics")
+        temp_db.upsert_game("1", "2024-12-12", 1, 2, 100, 98, "Final", 2024)
+
+        temp_db.upsert_player(1, "LeBron", "James", is_star=True)
+        temp_db.upsert_player(2, "Joe", "Smith", is_star=False)
+        temp_db.upsert_player(3, "Jayson", "Tatum", is_star=True)
+        temp_db.upsert_game_player("1", 1, "LeBron James")
+        temp_db.upsert_game_player("1", 2, "Joe Smith")
+        temp_db.upsert_game_player("1", 3, "Jayson Tatum")
+
+        games = temp_db.get_games_in_range("2024-12-11", "2024-12-14")
+        assert games[0]["star_count"] == 2
 
     def test_has_games_for_date(self, temp_db):
         """Test checking if games exist for a date."""
@@ -149,6 +243,16 @@ class TestNBADatabase:
         assert temp_db.has_games_for_date("2024-12-15") is True
         assert temp_db.has_games_for_date("2024-12-16") is False
 
+    def test_get_final_game_ids(self, temp_db):
+        """Test getting stored final game IDs for a date range."""
+        temp_db.upsert_team(1, "LAL", "Los Angeles Lakers")
+        temp_db.upsert_team(2, "BOS", "Boston Celtics")
+        temp_db.upsert_game("1", "2024-12-10", 1, 2, 100, 98, "Final", 2024)
+        temp_db.upsert_game("2", "2024-12-12", 1, 2, 105, 102, "Final", 2024)
+        temp_db.upsert_game("3", "2024-12-12", 1, 2, 50, 48, "In Progress", 2024)
+
+        assert temp_db.get_final_game_ids("2024-12-11", "2024-12-14") == {"2"}
+
     # Game player operations
     def test_upsert_game_player(self, temp_db):
         """Test inserting game player stats."""
@@ -169,6 +273,64 @@ class TestNBADatabase:
 
         assert temp_db.has_game_players("123") is True
 
+    def test_get_game_ids_with_players(self, temp_db):
+        """Test one query reports which games already have player stats."""
+        temp_db.upsert_team(1, "LAL", "Los Angeles Lakers")
+        temp_db.upsert_team(2, "BOS", "Boston Celtics")
+        temp_db.upsert_game("123", "2024-12-15", 1, 2, 100, 98, "Final", 2024)
+        temp_db.upsert_game("456", "2024-12-15", 2, 1, 90, 88, "Final", 2024)
+        temp_db.upsert_game_player("123", 1, "LeBron James", 1, 30, 10, 8)
+
+        assert temp_db.get_game_ids_with_players(["123", "456"]) == {"123"}
+        assert temp_db.get_game_ids_with_players([]) == set()
+
+    def test_upsert_game_players_keeps_star_flag(self, temp_db):
+        """Test bulk game player upserts store every row and keep star flags."""
+        temp_db.upsert_team(1, "LAL", "Los Angeles Lakers")
+        temp_db.upsert_team(2, "BOS", "Boston Celtics")
+        temp_db.upsert_games(
+            [
+                {
+                    "game_id": "123",
+                    "game_date": "2024-12-15",
+                    "home_team_id": 1,
+                    "away_team_id": 2,
+                    "home_score": 100,
+                    "away_score": 98,
+                    "status": "Final",
+                    "season": 2024,
+                }
+            ]
+        )
+        temp_db.upsert_player(1, "LeBron", "James", team_id=1, is_star=True)
+
+        temp_db.upsert_game_players(
+            [
+                {
+                    "game_id": "123",
+                    "player_id": 1,
+                    "player_name": "LeBron James",
+                    "team_id": 1,
+                    "points": 30,
+                    "rebounds": 10,
+                    "assists": 8,
+                },
+                {
+                    "game_id": "123",
+                    "player_id": 2,
+                    "player_name": "Jayson Tatum",
+                    "team_id": 2,
+                    "points": 28,
+                    "rebounds": 9,
+                    "assists": 4,
+                },
+            ]
+        )
+
+        assert temp_db.has_game_players("123") is True
+        assert temp_db.get_star_players() == ["LeBron James"]
+        assert temp_db.get_star_players_in_game("123") == 1
+
     def test_get_star_players_in_game(self, temp_db):
         """Test counting star players in a game."""
         temp_db.upsert_team(1, "LAL", "Los Angeles Lakers")
@@ -204,6 +366,25 @@ class TestNBADatabase:
         top_teams = temp_db.get_top_teams(5)
         assert "LAL" in top_teams
 
+    def test_upsert_standings_rows(self, temp_db):
+        """Test inserting standings for many teams at once."""
+        temp_db.upsert_standings_rows(
+            [
+                {
+                    "team_id": team_id,
+                    "team_abbr": abbr,
+                    "season": 2024,
+                    "wins": wins,
+                    "losses": 82 - wins,
+                    "win_pct": wins / 82,
+                    "conf_rank": 1,
+                }
+                for team_id, abbr, wins in [(1, "LAL", 40), (2, "BOS", 60)]
+            ]
+        )
+
+        assert temp_db.get_top_teams(2) == ["BOS", "LAL"]
+
     def test_get_top_teams(self, temp_db):
         """Test getting top teams by win percentage."""
         temp_db.upsert_team(1, "BOS", "Boston Celtics")
@@ -1,24 +1,107 @@
 """Unit tests for NBAClient class (nba_api + SQLite)."""
 
 import pytest
+import socket
+import sqlite3
 import tempfile
+import threading
 import os
-from datetime import datetime
-from unittest.mock import patch
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from src.api import nba_api_client
 from src.api.nba_api_client import (
+    API_BURST,
     NBAClient,
     NBASyncService,
+    RateLimiter,
     FALLBACK_TOP_TEAMS,
     FALLBACK_STAR_PLAYERS,
+    HTTP_POOL_SIZE,
+    MAX_RETRY_AFTER,
 )
 
 
+def _data_set(rows):
+    """Build an nba_api result set from a list of row dicts."""
+    from nba_api.stats.endpoints._base import Endpoint
+
+    headers = list(rows[0]) if rows else []
+    return Endpoint.DataSet(
+        data={"headers": headers, "data": [list(row.values()) for row in rows]}
+    )
+
+
+def _finder_frame(game_date):
+    """Build a LeagueGameFinder frame for one LAL-BOS game."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
+            {
+                "GAME_ID": "0022400001",
+                "GAME_DATE": game_date,
+                "MATCHUP": "LAL vs. BOS",
+                "TEAM_ABBREVIATION": "LAL",
+                "PTS": 110,
+            },
+            {
+                "GAME_ID": "0022400001",
+                "GAME_DATE": game_date,
+                "MATCHUP": "BOS @ LAL",
+                "TEAM_ABBREVIATION": "BOS",
+                "PTS": 108,
+            },
+        ]
+    )
+
+
+class _LocalServer:
+    """Minimal TCP server for driving the real mounted HTTP adapter."""
+
+    def __init__(self, handle=None):
+        """
+        Args:
+            handle: Called with each accepted connection; None leaves the
+                connection hanging without a response
+        """
+        self._handle = handle
+        self._sock = socket.create_server(("127.0.0.1", 0))
+        self._sock.settimeout(0.05)
+        self.url = f"http://127.0.0.1:{self._sock.getsockname()[1]}/"
+        self.connections = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        for conn in self.connections:
+            conn.close()
+        self._sock.close()
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except socket.timeout:
+                continue
+            self.connections.append(conn)
+            if self._handle:
+                self._handle(conn)
+
+
 class TestNBAClient:
     """Test cases for NBAClient class using nba_api with SQLite caching."""
 
     @pytest.fixture
-    def config_file(self):
+    def config_file(self, monkeypatch):
         """Create a temporary config file for testing."""
+        # Let the config's database path win over the suite-wide scratch one
+        monkeypatch.delenv("DATABASE_PATH", raising=False)
         config_content = """
 database:
   path: "{db_path}"
@@ -47,8 +130,20 @@ database:
         client = NBAClient(config_path=config_path)
 
         assert client.db is not None
-        assert client._top_teams_cache is not None
-        assert client._star_players_cache is not None
+
+    def test_metadata_loads_lazily(self, config_file):
+        """Test top teams and star players are only read from the DB on access."""
+        config_path, db_path = config_file
+
+        with patch(
+            "src.api.nba_api_client.NBADatabase.get_top_teams", return_value=["LAL"]
+        ) as mock:
+            client = NBAClient(config_path=config_path)
+            mock.assert_not_called()
+
+            assert client.TOP_5_TEAMS == {"LAL"}
+            assert client.STAR_PLAYERS == FALLBACK_STAR_PLAYERS
+            mock.assert_called_once()
 
     def test_initialization_uses_fallback_when_db_empty(self, config_file):
         """Test that fallback data is used when database is empty."""
@@ -96,6 +191,63 @@ database:
         assert "LeBron James" in stars
         assert "Stephen Curry" in stars
 
+    def test_metadata_reloads_after_ttl(self, config_file):
+        """Test expired metadata is served stale while it reloads in the background."""
+        from freezegun import freeze_time
+        from src.api.nba_api_client import METADATA_TTL
+        from src.utils.database import NBADatabase
+
+        config_path, db_path = config_file
+
+        with freeze_time("2024-12-15 12:00:00") as frozen:
+            client = NBAClient(config_path=config_path)
+            assert client.TOP_5_TEAMS == FALLBACK_TOP_TEAMS
+
+            # Simulate a sync writing fresh standings
+            db = NBADatabase(db_path=db_path)
+            db.upsert_team(1, "LAL", "Los Angeles Lakers")
+            db.upsert_standings(1, "LAL", 2024, 25, 5, 0.833, 1)
+
+            # Still within TTL: cached value is served
+            assert client.TOP_5_TEAMS == FALLBACK_TOP_TEAMS
+
+            # Past TTL: the stale value comes back at once and a reload starts
+            frozen.tick(METADATA_TTL)
+            assert client.TOP_5_TEAMS == FALLBACK_TOP_TEAMS
+
+            # The single refresh worker runs jobs in order, so this waits for it
+            client._refresh_executor.submit(lambda: None).result()
+            assert client.TOP_5_TEAMS == {"LAL"}
+
+    def test_metadata_past_stale_ttl_reloads_inline(self, config_file):
+        """Test metadata too old to serve stale is reloaded before returning."""
+        from freezegun import freeze_time
+        from src.api.nba_api_client import METADATA_TTL, METADATA_STALE_TTL
+
+        config_path, db_path = config_file
+
+        with freeze_time("2024-12-15 12:00:00") as frozen:
+            client = NBAClient(config_path=config_path)
+            assert client.TOP_5_TEAMS == FALLBACK_TOP_TEAMS
+
+            frozen.tick(METADATA_TTL + METADATA_STALE_TTL)
+            with patch.object(client.db, "get_top_teams", return_value=["LAL"]):
+                assert client.TOP_5_TEAMS == {"LAL"}
+
+    def test_invalidate_metadata_forces_reload(self, config_file):
+        """Test invalidate_metadata makes the next access reload from the DB."""
+        config_path, db_path = config_file
+        client = NBAClient(config_path=config_path)
+        assert client.TOP_5_TEAMS == FALLBACK_TOP_TEAMS
+
+        with patch.object(client.db, "get_top_teams", return_value=["LAL"]) as mock:
+            assert client.TOP_5_TEAMS == FALLBACK_TOP_TEAMS
+            mock.assert_not_called()
+
+            client.invalidate_metadata()
+            assert client.TOP_5_TEAMS == {"LAL"}
+            mock.assert_called_once()
+
     def test_is_top5_team(self, config_file):
         """Test is_top5_team method."""
         config_path, db_path = config_file
@@ -103,6 +255,7 @@ database:
 
         # Uses fallback data
         assert client.is_top5_team("CLE") is True  # In fallback
+        assert client.is_top5_team("cle") is True
         assert client.is_top5_team("XXX") is False
 
     def test_get_games_last_n_days_returns_empty_when_no_data(self, config_file):
@@ -140,13 +293,112 @@ database:
         assert games[0]["total_points"] == 233
         assert games[0]["final_margin"] == 3
 
+    def test_star_counts_come_from_range_query(self, config_file):
+        """Test star counts are read with the games, not queried per game."""
+        config_path, db_path = config_file
+
+        from src.utils.database import NBADatabase
+        from datetime import timedelta
+
+        db = NBADatabase(db_path=db_path)
+        db.upsert_team(1, "LAL", "Los Angeles Lakers")
+        db.upsert_team(2, "BOS", "Boston Celtics")
+        game_date = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+        db.upsert_game("12345", game_date, 1, 2, 118, 115, "Final", 2024)
+        db.upsert_game("12346", game_date, 2, 1, 100, 99, "Final", 2024)
+        db.upsert_player(1, "LeBron", "James", is_star=True)
+        db.upsert_game_player("12345", 1, "LeBron James")
+
+        client = NBAClient(config_path=config_path)
+        with patch.object(client.db, "get_star_players_in_game") as mock_stars:
+            games = client.get_games_last_n_days(days=7)
+
+        mock_stars.assert_not_called()
+        star_counts = {g["game_id"]: g["star_players_count"] for g in games}
+        assert star_counts == {"12345": 1, "12346": 0}
+
+    def test_iter_games_last_n_days_is_lazy(self, config_file):
+        """Test iter_games_last_n_days does no work until it is consumed."""
+        config_path, db_path = config_file
+        client = NBAClient(config_path=config_path)
+
+        with patch.object(client.db, "get_games_in_range", return_value=[]) as mock:
+            games = client.iter_games_last_n_days(days=7)
+            mock.assert_not_called()
+
+            assert list(games) == []
+            mock.assert_called_once()
+
+
+class TestRateLimiter:
+    """Test cases for the adaptive RateLimiter."""
+
+    def test_acquire_spaces_out_calls(self):
+        """Test acquire only sleeps for the remainder of the interval."""
+        limiter = RateLimiter(rate=2)
+
+        with patch("src.api.nba_api_client.time.sleep") as mock_sleep:
+            limiter.acquire()
+            mock_sleep.assert_not_called()
+
+            limiter.acquire()
+            mock_sleep.assert_called_once()
+            assert 0 < mock_sleep.call_args[0][0] <= 0.5
+
+    def test_acquire_allows_burst_then_spaces_out_calls(self):
+        """Test an idle limiter lets `burst` calls through before waiting."""
+        limiter = RateLimiter(rate=2, burst=3)
+
+        with patch("src.api.nba_api_client.time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.acquire()
+            mock_sleep.assert_not_called()
+
+            limiter.acquire()
+            mock_sleep.assert_called_once()
+            assert 0 < mock_sleep.call_args[0][0] <= 0.5
+
+    def test_penalize_halves_rate_down_to_floor(self):
+        """Test penalize halves the rate but never below min_rate."""
+        limiter = RateLimiter(rate=2, min_rate=0.5)
+
+        limiter.penalize()
+        assert limiter.rate == 1
+        limiter.penalize()
+        limiter.penalize()
+        assert limiter.rate == 0.5
+
+    def test_successes_raise_rate_up_to_ceiling(self):
+        """Test a streak of successes raises the rate, capped at max_rate."""
+        limiter = RateLimiter(rate=2, max_rate=2.1, increase_after=3)
+
+        for _ in range(2):
+            limiter.record_success()
+        assert limiter.rate == 2
+
+        limiter.record_success()
+        assert limiter.rate == pytest.approx(2.1)
+
+        for _ in range(3):
+            limiter.record_success()
+        assert limiter.rate == pytest.approx(2.1)
+
 
 class TestNBASyncService:
     """Test cases for NBASyncService class."""
 
+    @pytest.fixture(autouse=True)
+    def api_limiter(self, monkeypatch):
+        """Give each test its own unthrottled process-wide limiter."""
+        limiter = RateLimiter(1000, burst=API_BURST)
+        monkeypatch.setattr(nba_api_client, "_api_limiter", limiter)
+        return limiter
+
     @pytest.fixture
-    def config_file(self):
+    def config_file(self, monkeypatch):
         """Create a temporary config file for testing."""
+        # Let the config's database path win over the suite-wide scratch one
+        monkeypatch.delenv("DATABASE_PATH", raising=False)
         temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
         temp_db.close()
 
@@ -186,6 +438,152 @@ database:
         assert len(parts) == 2
         assert len(parts[1]) == 2  # Last two digits of year
 
+    def test_initialization_installs_pooled_session(self, config_file):
+        """Test the sync service gives nba_api a pooled, retrying session."""
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        config_path, db_path = config_file
+        NBASyncService(config_path=config_path)
+
+        adapter = NBAStatsHTTP.get_session().get_adapter("https://stats.nba.com")
+        assert adapter._pool_maxsize == HTTP_POOL_SIZE
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.connect == 1
+        assert adapter.max_retries.read is False
+        assert 429 in adapter.max_retries.status_forcelist
+
+    def test_sync_services_share_one_session_and_limiter(self, config_file):
+        """Test concurrent syncs don't each install a session or limiter."""
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        config_path, db_path = config_file
+        first = NBASyncService(config_path=config_path)
+        session = NBAStatsHTTP.get_session()
+        second = NBASyncService(config_path=config_path)
+
+        assert NBAStatsHTTP.get_session() is session
+        assert first._limiter is second._limiter
+
+    def test_replaced_session_closes_after_last_request(self):
+        """Test a replaced session stays open until its requests finish."""
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        installed = NBAStatsHTTP.get_session()
+        shared = nba_api_client._SharedHTTPSession(lambda: None)
+        try:
+            stale = shared.checkout()
+            shared.checkout()
+
+            with patch.object(stale, "close") as mock_close:
+                shared.replace(stale)
+                assert NBAStatsHTTP.get_session() is not stale
+
+                shared.checkin(stale)
+                mock_close.assert_not_called()
+                shared.checkin(stale)
+                mock_close.assert_called_once()
+
+            # A second replace of the same stale session is a no-op
+            fresh = NBAStatsHTTP.get_session()
+            shared.replace(stale)
+            assert NBAStatsHTTP.get_session() is fresh
+        finally:
+            NBAStatsHTTP.get_session().close()
+            NBAStatsHTTP.set_session(installed)
+
+    def test_http_session_caps_retry_after(self, config_file):
+        """Test a long Retry-After is honored only up to MAX_RETRY_AFTER."""
+        from urllib3.response import HTTPResponse
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        config_path, db_path = config_file
+        NBASyncService(config_path=config_path)
+        retry = NBAStatsHTTP.get_session().get_adapter("https://").max_retries
+
+        throttled = HTTPResponse(status=429, headers={"Retry-After": "300"})
+        assert retry.get_retry_after(throttled) == MAX_RETRY_AFTER
+        assert retry.get_retry_after(HTTPResponse(status=429)) is None
+
+        short = HTTPResponse(status=429, headers={"Retry-After": "2"})
+        assert retry.get_retry_after(short) == 2
+        # The cap survives urllib3 copying the policy between attempts
+        assert (
+            retry.increment(response=throttled).get_retry_after(throttled)
+            == MAX_RETRY_AFTER
+        )
+
+    def test_http_session_reports_pushback_once_per_request(
+        self, config_file, api_limiter
+    ):
+        """Test only the first 429/5xx of a retried request slows the limiter."""
+        from urllib3.response import HTTPResponse
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        config_path, db_path = config_file
+        api_limiter.rate = 2
+        sync_service = NBASyncService(config_path=config_path)
+        retry = NBAStatsHTTP.get_session().get_adapter("https://").max_retries
+
+        retry = retry.increment("GET", "/", response=HTTPResponse(status=429))
+        assert sync_service._limiter.rate == 1
+
+        retry.increment("GET", "/", response=HTTPResponse(status=503))
+        assert sync_service._limiter.rate == 1
+
+    @patch("urllib3.util.retry.time.sleep")
+    def test_persistent_429_halves_rate_once(
+        self, mock_sleep, config_file, api_limiter
+    ):
+        """Test a request throttled on every retry counts as one decrease."""
+        import requests
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        config_path, db_path = config_file
+        api_limiter.rate = 4
+        sync_service = NBASyncService(config_path=config_path)
+
+        def throttle(conn):
+            conn.recv(65536)
+            conn.sendall(
+                b"HTTP/1.1 429 Too Many Requests\r\n"
+                b"Content-Length: 0\r\nConnection: close\r\n\r\n"
+            )
+
+        with _LocalServer(throttle) as server:
+
+            def ThrottledEndpoint(**params):
+                return NBAStatsHTTP.get_session().get(server.url, timeout=5)
+
+            with pytest.raises(requests.exceptions.RetryError):
+                sync_service._request(ThrottledEndpoint)
+
+            # Initial attempt plus three status retries, one decrease
+            assert len(server.connections) == 4
+            assert sync_service._limiter.rate == 2
+
+    def test_request_retries_read_timeout_once_on_fresh_session(self, config_file):
+        """Test a hung request reaches _request as a timeout and is retried once."""
+        import requests
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        config_path, db_path = config_file
+        sync_service = NBASyncService(config_path=config_path)
+        sessions = []
+
+        with _LocalServer() as server:
+
+            def HangingEndpoint(**params):
+                session = NBAStatsHTTP.get_session()
+                sessions.append(session)
+                return session.get(server.url, timeout=0.2)
+
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                sync_service._request(HangingEndpoint)
+
+            # One attempt per session: urllib3 doesn't retry the read itself
+            assert len(server.connections) == 2
+            assert sessions[0] is not sessions[1]
+
     @patch("nba_api.stats.static.teams.get_teams")
     def test_sync_teams(self, mock_get_teams, config_file):
         """Test sync_teams syncs team data."""
@@ -219,6 +617,316 @@ database:
         assert "LAL" in abbrs
         assert "BOS" in abbrs
 
+    @patch("nba_api.stats.endpoints.leaguegamefinder.LeagueGameFinder")
+    def test_sync_games_skips_stored_games(self, mock_finder, config_file):
+        """Test sync_games stores new games and skips ones already stored."""
+        import pandas as pd
+        from datetime import timedelta
+
+        config_path, db_path = config_file
+        game_date = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+
+        mock_finder.return_value.get_data_frames.return_value = [
+            pd.DataFrame(
+                [
+                    {
+                        "GAME_ID": "0022400001",
+                        "GAME_DATE": game_date,
+                        "MATCHUP": "LAL vs. BOS",
+                        "TEAM_ABBREVIATION": "LAL",
+                        "PTS": 110,
+                    },
+                    {
+                        "GAME_ID": "0022400001",
+                        "GAME_DATE": game_date,
+                        "MATCHUP": "BOS @ LAL",
+                        "TEAM_ABBREVIATION": "BOS",
+                        "PTS": 108,
+                    },
+                    {
+                        "GAME_ID": "0022400002",
+                        "GAME_DATE": game_date,
+                        "MATCHUP": "GSW @ DEN",
+                        "TEAM_ABBREVIATION": "GSW",
+                        "PTS": 120,
+                    },
+                    {
+                        "GAME_ID": "0022400002",
+                        "GAME_DATE": game_date,
+                        "MATCHUP": "DEN vs. GSW",
+                        "TEAM_ABBREVIATION": "DEN",
+                        "PTS": 125,
+                    },
+                ]
+            )
+        ]
+
+        sync_service = NBASyncService(config_path=config_path)
+        for team_id, abbr in [(1, "LAL"), (2, "BOS"), (3, "GSW"), (4, "DEN")]:
+            sync_service.db.upsert_team(team_id, abbr, abbr)
+        sync_service.db.upsert_game(
+            "0022400001", game_date, 1, 2, 110, 108, "Final", 2024
+        )
+
+        with patch.object(sync_service, "_sync_players") as mock_players:
+            count = sync_service.sync_games(days=7)
+
+        assert count == 1
+        # Stored games still get their player stats checked
+        assert mock_players.call_args.args[2] == ["0022400001", "0022400002"]
+        games = {g["game_id"]: g for g in sync_service.db.get_games_for_date(game_date)}
+        assert games["0022400002"]["home_abbr"] == "DEN"
+        assert games["0022400002"]["home_score"] == 125
+        assert games["0022400002"]["away_score"] == 120
+
+    @patch("nba_api.stats.endpoints.leaguegamelog.LeagueGameLog")
+    @patch("nba_api.stats.endpoints.leaguegamefinder.LeagueGameFinder")
+    def test_sync_games_stores_player_stats(
+        self, mock_finder, mock_game_log, config_file
+    ):
+        """Test sync_games fills game_players so star counts reach the games."""
+        config_path, db_path = config_file
+        game_date = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+        mock_finder.return_value.get_data_frames.return_value = [
+            _finder_frame(game_date)
+        ]
+        mock_game_log.return_value.data_sets = [
+            _data_set(
+                [
+                    {
+                        "GAME_ID": "0022400001",
+                        "PLAYER_ID": 2544,
+                        "PLAYER_NAME": "LeBron James",
+                        "TEAM_ID": 1,
+                        "PTS": 30,
+                        "REB": 8,
+                        "AST": 9,
+                    },
+                    {
+                        "GAME_ID": "0022400001",
+                        "PLAYER_ID": 1628369,
+                        "PLAYER_NAME": "Jayson Tatum",
+                        "TEAM_ID": 2,
+                        "PTS": 28,
+                        "REB": 10,
+                        "AST": 4,
+                    },
+                ]
+            )
+        ]
+
+        sync_service = NBASyncService(config_path=config_path)
+        for team_id, abbr in [(1, "LAL"), (2, "BOS")]:
+            sync_service.db.upsert_team(team_id, abbr, abbr)
+
+        assert sync_service.sync_games(days=7) == 1
+        sync_service.db.set_star_players(["LeBron James"])
+
+        # One game log request covers the whole window
+        mock_game_log.assert_called_once()
+        params = mock_game_log.call_args.kwargs
+        assert params["player_or_team_abbreviation"] == "P"
+        assert params["date_from_nullable"] != params["date_to_nullable"]
+
+        assert sync_service.db.has_game_players("0022400001")
+        games = sync_service.db.get_games_in_range(game_date, game_date)
+        assert games[0]["star_count"] == 1
+
+    @patch("nba_api.stats.endpoints.leaguegamefinder.LeagueGameFinder")
+    def test_sync_games_survives_player_sync_errors(self, mock_finder, config_file):
+        """Test a failing player sync still records the committed games."""
+        config_path, db_path = config_file
+        game_date = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+        mock_finder.return_value.get_data_frames.return_value = [
+            _finder_frame(game_date)
+        ]
+
+        sync_service = NBASyncService(config_path=config_path)
+        for team_id, abbr in [(1, "LAL"), (2, "BOS")]:
+            sync_service.db.upsert_team(team_id, abbr, abbr)
+
+        with patch.object(
+            sync_service.db,
+            "get_game_ids_with_players",
+            side_effect=sqlite3.OperationalError("database is locked"),
+        ):
+            count = sync_service.sync_games(days=7)
+
+        assert count == 1
+        assert sync_service.db.get_last_sync("games") is not None
+
+    @patch("nba_api.stats.endpoints.leaguegamelog.LeagueGameLog")
+    def test_sync_players_for_dates_uses_one_request(self, mock_game_log, config_file):
+        """Test _sync_players_for_dates stores players for many games at once."""
+        config_path, db_path = config_file
+        mock_game_log.return_value.data_sets = [
+            _data_set(
+                [
+                    {
+                        "GAME_ID": "0022400001",
+                        "PLAYER_ID": 2544,
+                        "PLAYER_NAME": "LeBron James",
+                        "TEAM_ID": 1,
+                        "PTS": 30,
+                        "REB": 8,
+                        "AST": 9,
+                    },
+                    {
+                        "GAME_ID": "0022400002",
+                        "PLAYER_ID": 201939,
+                        "PLAYER_NAME": "Stephen Curry",
+                        "TEAM_ID": 3,
+                        "PTS": 35,
+                        "REB": 5,
+                        "AST": 7,
+                    },
+                ]
+            )
+        ]
+
+        sync_service = NBASyncService(config_path=config_path)
+        missing = sync_service._sync_players_for_dates(
+            "12/01/2024", "12/01/2024", ["0022400001", "0022400002", "0022400003"]
+        )
+
+        mock_game_log.assert_called_once()
+        assert missing == ["0022400003"]
+        assert sync_service.db.has_game_players("0022400001")
+        assert sync_service.db.has_game_players("0022400002")
+
+    @patch("nba_api.stats.endpoints.boxscoretraditionalv2.BoxScoreTraditionalV2")
+    @patch("nba_api.stats.endpoints.leaguegamelog.LeagueGameLog")
+    def test_sync_players_skips_games_with_stored_players(
+        self, mock_game_log, mock_box_score, config_file
+    ):
+        """Test games whose player stats are stored cost no API request."""
+        config_path, db_path = config_file
+        sync_service = NBASyncService(config_path=config_path)
+        sync_service.db.upsert_game_players(
+            [
+                {
+                    "game_id": game_id,
+                    "player_id": 2544,
+                    "player_name": "LeBron James",
+                    "team_id": 1,
+                    "points": 30,
+                    "rebounds": 8,
+                    "assists": 9,
+                }
+                for game_id in ["0022400001", "0022400002"]
+            ]
+        )
+
+        sync_service._sync_players(
+            "11/25/2024", "12/01/2024", ["0022400001", "0022400002"]
+        )
+
+        mock_game_log.assert_not_called()
+        mock_box_score.assert_not_called()
+
+    @patch("nba_api.stats.endpoints.boxscoretraditionalv2.BoxScoreTraditionalV2")
+    @patch("nba_api.stats.endpoints.leaguegamelog.LeagueGameLog")
+    def test_sync_players_falls_back_to_box_scores(
+        self, mock_game_log, mock_box_score, config_file
+    ):
+        """Test games missing from the game log get their box scores fetched."""
+        config_path, db_path = config_file
+        mock_game_log.return_value.data_sets = [
+            _data_set(
+                [
+                    {
+                        "GAME_ID": "0022400001",
+                        "PLAYER_ID": 2544,
+                        "PLAYER_NAME": "LeBron James",
+                        "TEAM_ID": 1,
+                        "PTS": 30,
+                        "REB": 8,
+                        "AST": 9,
+                    }
+                ]
+            )
+        ]
+        mock_box_score.side_effect = lambda game_id: MagicMock(
+            data_sets=[
+                _data_set(
+                    [
+                        {
+                            "GAME_ID": game_id,
+                            "PLAYER_ID": int(game_id[-1]),
+                            "PLAYER_NAME": f"Player {game_id}",
+                            "TEAM_ID": 3,
+                            "PTS": 20,
+                            "REB": 5,
+                            "AST": 5,
+                        }
+                    ]
+                )
+            ]
+        )
+
+        sync_service = NBASyncService(config_path=config_path)
+        game_ids = ["0022400001", "0022400002", "0022400003"]
+        sync_service._sync_players("11/25/2024", "12/01/2024", game_ids)
+
+        fetched = sorted(
+            call.kwargs["game_id"] for call in mock_box_score.call_args_list
+        )
+        assert fetched == ["0022400002", "0022400003"]
+        assert sync_service.db.get_game_ids_with_players(game_ids) == set(game_ids)
+
+    @patch("nba_api.stats.endpoints.boxscoretraditionalv2.BoxScoreTraditionalV2")
+    @patch("nba_api.stats.endpoints.leaguegamelog.LeagueGameLog")
+    def test_sync_players_skips_box_scores_when_game_log_fails(
+        self, mock_game_log, mock_box_score, config_file
+    ):
+        """Test a failed game log request doesn't fan out to per-game requests."""
+        config_path, db_path = config_file
+        mock_game_log.side_effect = ValueError("bad response")
+
+        sync_service = NBASyncService(config_path=config_path)
+        sync_service._sync_players("11/25/2024", "12/01/2024", ["0022400001"])
+
+        mock_box_score.assert_not_called()
+
+    def test_sync_all_runs_every_sync(self, config_file):
+        """Test sync_all syncs teams first and collects all results."""
+        config_path, db_path = config_file
+        sync_service = NBASyncService(config_path=config_path)
+
+        with (
+            patch.object(sync_service, "sync_teams", return_value=30) as teams,
+            patch.object(sync_service, "sync_standings", return_value=30),
+            patch.object(sync_service, "sync_star_players", return_value=25),
+            patch.object(sync_service, "sync_games", return_value=42) as games,
+        ):
+            results = sync_service.sync_all(days=7)
+
+        teams.assert_called_once()
+        games.assert_called_once_with(7)
+        assert results == {
+            "teams": 30,
+            "standings": 30,
+            "star_players": 25,
+            "games": 42,
+        }
+
+    def test_sync_metadata_skips_games(self, config_file):
+        """Test sync_metadata syncs teams first and never fetches games."""
+        config_path, db_path = config_file
+        sync_service = NBASyncService(config_path=config_path)
+
+        with (
+            patch.object(sync_service, "sync_teams", return_value=30) as teams,
+            patch.object(sync_service, "sync_standings", return_value=30),
+            patch.object(sync_service, "sync_star_players", return_value=25),
+            patch.object(sync_service, "sync_games") as games,
+        ):
+            results = sync_service.sync_metadata()
+
+        teams.assert_called_once()
+        games.assert_not_called()
+        assert results == {"teams": 30, "standings": 30, "star_players": 25}
+
     def test_get_sync_status(self, config_file):
         """Test get_sync_status returns database stats."""
         config_path, db_path = config_file
@@ -71,7 +71,7 @@ scoring:
         ]
 
         mock_client_instance = Mock()
-        mock_client_instance.get_games_last_n_days.return_value = games
+        mock_client_instance.iter_games_last_n_days.return_value = iter(games)
         mock_client_instance.TOP_5_TEAMS = {"LAL", "BOS", "DEN", "MIL", "PHX"}
         mock_nba_client.return_value = mock_client_instance
 
@@ -85,7 +85,7 @@ scoring:
     def test_get_best_game_no_games_returns_none(self, config_file, mock_nba_client):
         """Test get_best_game returns None when no games found."""
         mock_client_instance = Mock()
-        mock_client_instance.get_games_last_n_days.return_value = []
+        mock_client_instance.iter_games_last_n_days.return_value = iter([])
         mock_nba_client.return_value = mock_client_instance
 
         recommender = GameRecommender(config_path=config_file)
@@ -103,7 +103,7 @@ scoring:
         ]
 
         mock_client_instance = Mock()
-        mock_client_instance.get_games_last_n_days.return_value = games
+        mock_client_instance.iter_games_last_n_days.return_value = iter(games)
         mock_client_instance.TOP_5_TEAMS = {"LAL", "BOS", "DEN", "MIL", "PHX"}
         mock_nba_client.return_value = mock_client_instance
 
@@ -122,7 +122,7 @@ scoring:
         ]
 
         mock_client_instance = Mock()
-        mock_client_instance.get_games_last_n_days.return_value = games
+        mock_client_instance.iter_games_last_n_days.return_value = iter(games)
         mock_client_instance.TOP_5_TEAMS = {"LAL", "BOS", "DEN", "MIL", "PHX"}
         mock_nba_client.return_value = mock_client_instance
 
@@ -137,21 +137,23 @@ scoring:
     def test_get_best_game_calls_client_with_days(self, config_file, mock_nba_client):
         """Test get_best_game passes days parameter to client."""
         mock_client_instance = Mock()
-        mock_client_instance.get_games_last_n_days.return_value = [get_sample_game()]
+        mock_client_instance.iter_games_last_n_days.return_value = iter(
+            [get_sample_game()]
+        )
         mock_client_instance.TOP_5_TEAMS = set()
         mock_nba_client.return_value = mock_client_instance
 
         recommender = GameRecommender(config_path=config_file)
         recommender.get_best_game(days=14)
 
-        mock_client_instance.get_games_last_n_days.assert_called_once_with(14)
+        mock_client_instance.iter_games_last_n_days.assert_called_once_with(14)
 
     def test_get_best_game_prints_messages(self, config_file, mock_nba_client, capsys):
         """Test get_best_game prints informative messages."""
         games = [get_sample_game()]
 
         mock_client_instance = Mock()
-        mock_client_instance.get_games_last_n_days.return_value = games
+        mock_client_instance.iter_games_last_n_days.return_value = iter(games)
         mock_client_instance.TOP_5_TEAMS = set()
         mock_nba_client.return_value = mock_client_instance
 
@@ -280,7 +282,7 @@ scoring:
         games = [get_sample_game()]
 
         mock_client_instance = Mock()
-        mock_client_instance.get_games_last_n_days.return_value = games
+        mock_client_instance.iter_games_last_n_days.return_value = iter(games)
         mock_client_instance.TOP_5_TEAMS = set()
         mock_nba_client.return_value = mock_client_instance
 
@@ -337,7 +339,7 @@ scoring:
         games = [get_sample_game()]
 
         mock_client_instance = Mock()
-        mock_client_instance.get_games_last_n_days.return_value = games
+        mock_client_instance.iter_games_last_n_days.return_value = iter(games)
         mock_client_instance.TOP_5_TEAMS = set()
         mock_nba_client.return_value = mock_client_instance
 